@@ -1,14 +1,86 @@
 import random
+from array import array
 from collections import deque
 import time
+import numpy as np
 import matplotlib.pyplot as plt
 
+try:
+    import scipy.sparse as sparse
+except ImportError:  # scipy необязателен: без него доступны COO-массивы и построчный вывод
+    sparse = None
+
+# Построение CSR-представления смежности: соседи вершины v лежат в
+# neighbors[offsets[v]:offsets[v + 1]] в порядке следования рёбер.
+# При reverse=True строятся входящие рёбра (обратный граф).
+def build_csr(num_vert, edges, directed, reverse=False):
+    offsets = array('i', [0]) * (num_vert + 1)
+    for u, v in edges:
+        offsets[(v if reverse else u) + 1] += 1
+        if not directed:
+            offsets[v + 1] += 1
+    for i in range(num_vert):
+        offsets[i + 1] += offsets[i]
+
+    neighbors = array('i', [0]) * offsets[num_vert]
+    pos = offsets[:-1]
+    for u, v in edges:
+        if reverse:
+            u, v = v, u
+        neighbors[pos[u]] = v
+        pos[u] += 1
+        if not directed:
+            neighbors[pos[v]] = u
+            pos[v] += 1
+    return offsets, neighbors
+
+
 # Класс графа
 class Graph:
     def __init__(self, num_vert, edges, directed=False):
         self.num_vert = num_vert
-        self.edges = edges
         self.directed = directed
+        self.edges = edges
+
+    # Список рёбер хранится через свойство, чтобы при его замене сбрасывался кэш смежности
+    @property
+    def edges(self):
+        return self._edges
+
+    @edges.setter
+    def edges(self, edges):
+        self._edges = edges
+        self.invalidate()
+
+    # Добавление ребра со сбросом кэша
+    def add_edge(self, u, v):
+        self._edges.append((u, v))
+        self.invalidate()
+
+    # Сброс кэша (нужно вызвать вручную, если список рёбер изменён напрямую)
+    def invalidate(self):
+        self._csr = None
+        self._reverse_csr = None
+
+    # Компактное представление смежности в формате CSR (см. build_csr).
+    # Строится один раз за O(V + E) и переиспользуется всеми обходами.
+    def csr(self):
+        if self._csr is None:
+            self._csr = build_csr(self.num_vert, self._edges, self.directed)
+        return self._csr
+
+    # CSR обратного графа (входящие рёбра); для неориентированного графа совпадает с csr()
+    def reverse_csr(self):
+        if not self.directed:
+            return self.csr()
+        if self._reverse_csr is None:
+            self._reverse_csr = build_csr(self.num_vert, self._edges, True, reverse=True)
+        return self._reverse_csr
+
+    # Соседи вершины (срез из CSR)
+    def neighbors(self, v):
+        offsets, neighbors = self.csr()
+        return neighbors[offsets[v]:offsets[v + 1]]
 
     # Матрица смежности
     def adjacency_matrix(self):
@@ -30,58 +102,269 @@ class Graph:
                 matrix[v][i] = 1
         return matrix
 
+    # Разреженная матрица смежности в формате COO: массивы (строки, столбцы)
+    # ненулевых элементов (все значения равны 1, повторные рёбра не дублируются)
+    def adjacency_coo(self):
+        n = self.num_vert
+        rows = array('i')
+        cols = array('i')
+        seen = set()
+        for u, v in self._edges:
+            pairs = ((u, v),) if self.directed else ((u, v), (v, u))
+            for a, b in pairs:
+                if a * n + b not in seen:
+                    seen.add(a * n + b)
+                    rows.append(a)
+                    cols.append(b)
+        return rows, cols
+
+    # Разреженная матрица инцидентности в формате COO: массивы (строки, столбцы, значения)
+    def incidence_coo(self):
+        rows = array('i')
+        cols = array('i')
+        data = array('b')
+        for i, (u, v) in enumerate(self._edges):
+            if u != v:
+                rows.append(u)
+                cols.append(i)
+                data.append(1)
+            rows.append(v)
+            cols.append(i)
+            data.append(-1 if self.directed else 1)
+        return rows, cols, data
+
+    # Матрица смежности в виде scipy.sparse.csr_matrix (требуется scipy)
+    def adjacency_sparse(self):
+        if sparse is None:
+            raise ImportError("для adjacency_sparse() требуется scipy")
+        rows, cols = self.adjacency_coo()
+        data = array('b', [1]) * len(rows)
+        return sparse.csr_matrix((data, (rows, cols)), shape=(self.num_vert, self.num_vert))
+
+    # Матрица инцидентности в виде scipy.sparse.csr_matrix (требуется scipy)
+    def incidence_sparse(self):
+        if sparse is None:
+            raise ImportError("для incidence_sparse() требуется scipy")
+        rows, cols, data = self.incidence_coo()
+        return sparse.csr_matrix((data, (rows, cols)), shape=(self.num_vert, len(self._edges)))
+
+    # Построчный вывод матрицы смежности: в памяти одновременно только одна строка
+    def adjacency_rows(self):
+        offsets, neighbors = self.csr()
+        for u in range(self.num_vert):
+            row = [0] * self.num_vert
+            for i in range(offsets[u], offsets[u + 1]):
+                row[neighbors[i]] = 1
+            yield row
+
+    # Построчный вывод матрицы инцидентности: в памяти одновременно только одна строка
+    def incidence_rows(self):
+        rows, cols, data = self.incidence_coo()
+        # Группируем ненулевые элементы по строкам (сортировка подсчётом)
+        offsets = array('i', [0]) * (self.num_vert + 1)
+        for u in rows:
+            offsets[u + 1] += 1
+        for i in range(self.num_vert):
+            offsets[i + 1] += offsets[i]
+        order = array('i', [0]) * len(rows)
+        pos = offsets[:-1]
+        for k, u in enumerate(rows):
+            order[pos[u]] = k
+            pos[u] += 1
+
+        for u in range(self.num_vert):
+            row = [0] * len(self._edges)
+            for k in order[offsets[u]:offsets[u + 1]]:
+                row[cols[k]] = data[k]
+            yield row
+
     # Список смежности
     def adjacency_list(self):
-        adj_list = {v: [] for v in range(self.num_vert)}
-        for u, v in self.edges:
-            adj_list[u].append(v)
-            if not self.directed:
-                adj_list[v].append(u)
-        return adj_list
+        offsets, neighbors = self.csr()
+        return {v: neighbors[offsets[v]:offsets[v + 1]].tolist() for v in range(self.num_vert)}
 
     # Список ребер
     def edge_list(self):
         return self.edges
 
 
-# Генератор случайных графов
+# Пул вершин, у которых ещё осталась ёмкость по степени (cap=None - без ограничения).
+# Случайная вершина выбирается за O(1); вершина с исчерпанной ёмкостью удаляется
+# из пула перестановкой с последним элементом, поэтому неудачных выборов не бывает.
+class CapacityPool:
+    def __init__(self, num_vert, cap):
+        self.vertices = list(range(num_vert)) if cap is None or cap > 0 else []
+        self.remaining = None if cap is None else [cap] * num_vert
+        self.index = list(range(num_vert))
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def choice(self, rng):
+        return self.vertices[rng.randrange(len(self.vertices))]
+
+    # Учитываем использование одной единицы ёмкости вершины
+    def use(self, v):
+        if self.remaining is None:
+            return
+        self.remaining[v] -= 1
+        if self.remaining[v] == 0:
+            i = self.index[v]
+            last = self.vertices.pop()
+            if last != v:
+                self.vertices[i] = last
+                self.index[last] = i
+
+
+# Генератор случайных графов.
+# Строит ровно num_edges рёбер без петель (кратные рёбра допускаются) за O(V + E)
+# в среднем: концы рёбер выбираются только из вершин с оставшейся ёмкостью по степени,
+# выпавшая петля (u == v) отбрасывается и выбор повторяется. Если ёмкость осталась
+# только у одной вершины x, случайное ребро (a, b) без x заменяется парой (a, x), (x, b).
+# Для ориентированного графа ограничиваются полустепени исхода/захода
+# (max_out_degree/max_in_degree), для неориентированного - степень max_degree.
+# seed делает результат воспроизводимым. Если ограничения не позволяют
+# построить нужное число рёбер, выбрасывается ValueError.
 def generate_random_graph(min_vert, max_vert, min_edges, max_edges, max_degree, directed=False,
-                          max_in_degree=None, max_out_degree=None):
-    num_vert = random.randint(min_vert, max_vert)
-    num_edges = random.randint(min_edges, max_edges)
+                          max_in_degree=None, max_out_degree=None, seed=None):
+    rng = random.Random(seed)
+    num_vert = rng.randint(min_vert, max_vert)
+    num_edges = rng.randint(min_edges, max_edges)
+
+    if directed:
+        out_pool = CapacityPool(num_vert, max_out_degree)
+        in_pool = CapacityPool(num_vert, max_in_degree)
+        capacity = min(num_edges if cap is None else num_vert * cap
+                       for cap in (max_out_degree, max_in_degree))
+    else:
+        out_pool = in_pool = CapacityPool(num_vert, max_degree)
+        capacity = num_edges if max_degree is None else num_vert * max_degree // 2
+    if num_edges > capacity or (num_edges > 0 and num_vert < 2):
+        raise ValueError(f"нельзя построить {num_edges} рёбер на {num_vert} вершинах с заданными ограничениями степени")
 
     edges = []
-    degree = [0] * num_vert
-
-    for i in range(num_edges):
-        u = random.randint(0, num_vert - 1)
-        v = random.randint(0, num_vert - 1)
+    while len(edges) < num_edges:
+        if len(out_pool) == 0 or len(in_pool) == 0:
+            raise ValueError(f"ёмкость степеней исчерпана после {len(edges)} из {num_edges} рёбер")
+
+        if len(out_pool) == 1 and len(in_pool) == 1 and out_pool.vertices[0] == in_pool.vertices[0]:
+            # Ёмкость осталась только у x, и ребро из неё было бы петлёй. Вставляем x
+            # в середину ребра (a, b): степени a и b не меняются, x тратит по единице
+            # ёмкости на каждый конец. Ребро без x существует, иначе все остальные
+            # вершины не могли бы исчерпать ёмкость
+            x = out_pool.vertices[0]
+            while True:
+                i = rng.randrange(len(edges))
+                a, b = edges[i]
+                if a != x and b != x:
+                    break
+            edges[i] = (a, x)
+            edges.append((x, b))
+            out_pool.use(x)
+            in_pool.use(x)
+            continue
 
+        u = out_pool.choice(rng)
+        v = in_pool.choice(rng)
         if u == v:
-            i = i - 1
             continue
+        out_pool.use(u)
+        in_pool.use(v)
+        edges.append((u, v))
 
+    return Graph(num_vert, edges, directed)
+
+
+# Векторизованный генератор для графов с миллионами рёбер (та же сигнатура).
+# Используется модель конфигураций: каждая вершина даёт столько "заготовок"
+# концов, какова её ёмкость, и нужное число заготовок выбирается без возвращения,
+# поэтому ограничения степени соблюдаются автоматически. Немногие получившиеся
+# петли устраняются: при неограниченной степени конец петли выбирается заново,
+# иначе конец обменивается со случайным подходящим ребром (степени не меняются),
+# а если такого ребра нет - концы петли выбираются заново из вершин с остатком
+# ёмкости. Если и это невозможно, граф строится генератором generate_random_graph,
+# поэтому ValueError выбрасывается только при действительно невыполнимых ограничениях.
+def generate_random_graph_numpy(min_vert, max_vert, min_edges, max_edges, max_degree, directed=False,
+                                max_in_degree=None, max_out_degree=None, seed=None):
+    rng = np.random.default_rng(seed)
+    num_vert = int(rng.integers(min_vert, max_vert, endpoint=True))
+    num_edges = int(rng.integers(min_edges, max_edges, endpoint=True))
+    if num_edges > 0 and num_vert < 2:
+        raise ValueError(f"нельзя построить {num_edges} рёбер на {num_vert} вершинах")
+
+    def sample_ends(cap, size):
+        if cap is None:
+            return rng.integers(0, num_vert, size)
+        if size > num_vert * cap:
+            raise ValueError(f"нельзя построить {num_edges} рёбер на {num_vert} вершинах с заданными ограничениями степени")
+        stubs = np.repeat(np.arange(num_vert), cap)
+        return rng.choice(stubs, size, replace=False)
+
+    if directed:
+        u = sample_ends(max_out_degree, num_edges)
+        v = sample_ends(max_in_degree, num_edges)
+    else:
+        ends = sample_ends(max_degree, 2 * num_edges)
+        u, v = ends[:num_edges], ends[num_edges:]
+
+    out_cap, in_cap = (max_out_degree, max_in_degree) if directed else (max_degree, max_degree)
+
+    # Вершины, у которых после удаления ребра i остаётся ёмкость на исходящем
+    # и входящем концах (для неориентированного графа обе маски совпадают)
+    def free_vertices(i):
+        keep = np.arange(num_edges) != i
         if directed:
-            if max_out_degree and degree[u] >= max_out_degree:
-                i = i - 1
-                continue
-            if max_in_degree and degree[v] >= max_in_degree:
-                i = i - 1
-                continue
+            out_used = np.bincount(u[keep], minlength=num_vert)
+            in_used = np.bincount(v[keep], minlength=num_vert)
         else:
-            if degree[u] >= max_degree or degree[v] >= max_degree:
-                i = i - 1
-                continue
+            out_used = in_used = np.bincount(np.concatenate((u[keep], v[keep])), minlength=num_vert)
+        return out_used < out_cap, in_used < in_cap
+
+    for i in np.flatnonzero(u == v):
+        # Неограниченная степень захода (или степень) - просто другой конец
+        if in_cap is None:
+            shift = int(rng.integers(1, num_vert))
+            v[i] = (u[i] + shift) % num_vert
+            continue
+        if out_cap is None:
+            shift = int(rng.integers(1, num_vert))
+            u[i] = (v[i] + shift) % num_vert
+            continue
 
-        edges.append((u, v))
-        degree[u] += 1
-        degree[v] += 1
+        # Обмен концами с ребром j: (u[i], v[j]) и (u[j], v[i]) не должны быть петлями.
+        # Сначала несколько случайных попыток, затем поиск по всем рёбрам
+        for j in rng.integers(num_edges, size=20).tolist():
+            if u[i] != v[j] and u[j] != v[i]:
+                break
+        else:
+            partners = np.flatnonzero((v != u[i]) & (u != v[i]))
+            j = int(rng.choice(partners)) if partners.size else -1
+        if j != -1:
+            v[i], v[j] = v[j], v[i]
+            continue
 
-    return Graph(num_vert, edges, directed)
+        # Подходящего ребра нет - выбираем концы заново среди вершин с остатком ёмкости
+        out_free, in_free = free_vertices(i)
+        sources = np.flatnonzero(out_free)
+        rng.shuffle(sources)
+        for a in sources.tolist():
+            targets = np.flatnonzero(in_free)
+            targets = targets[targets != a]
+            if targets.size:
+                u[i], v[i] = a, int(rng.choice(targets))
+                break
+        else:
+            # Нужна перестройка нескольких рёбер - строим граф генератором с пулами ёмкости
+            seed = int(rng.integers(2 ** 63))
+            return generate_random_graph(num_vert, num_vert, num_edges, num_edges, max_degree, directed,
+                                         max_in_degree, max_out_degree, seed=seed)
+
+    return Graph(num_vert, list(zip(u.tolist(), v.tolist())), directed)
 
 
 # Поиск в ширину (BFS)
 def bfs(graph, start, end):
+    offsets, neighbors = graph.csr()
     visited = set()
     queue = deque([(start, [start])])
 
@@ -91,12 +374,132 @@ def bfs(graph, start, end):
             return path
         if node not in visited:
             visited.add(node)
-            for neighbor in graph.adjacency_list()[node]:
+            for i in range(offsets[node], offsets[node + 1]):
+                neighbor = neighbors[i]
                 if neighbor not in visited:
                     queue.append((neighbor, path + [neighbor]))
     return None
 
 
+# Восстановление пути по массиву предков (от end к start и разворот)
+def restore_path(parent, start, end):
+    path = [end]
+    while end != start:
+        end = parent[end]
+        path.append(end)
+    path.reverse()
+    return path
+
+
+# BFS с массивом предков: путь не копируется при каждом добавлении в очередь,
+# а восстанавливается один раз, когда достигнута конечная вершина
+def bfs_parents(graph, start, end):
+    offsets, neighbors = graph.csr()
+    parent = array('i', [-1]) * graph.num_vert
+    parent[start] = start
+    queue = deque([start])
+
+    while queue:
+        node = queue.popleft()
+        if node == end:
+            return restore_path(parent, start, end)
+        for i in range(offsets[node], offsets[node + 1]):
+            neighbor = neighbors[i]
+            if parent[neighbor] == -1:
+                parent[neighbor] = node
+                queue.append(neighbor)
+    return None
+
+
+# Расстояния (в рёбрах) от start до всех вершин за один проход BFS.
+# Недостижимые вершины получают -1. Если задан набор targets,
+# обход прекращается, как только найдены расстояния до всех целей.
+def bfs_distances(graph, start, targets=None):
+    offsets, neighbors = graph.csr()
+    dist = array('i', [-1]) * graph.num_vert
+    dist[start] = 0
+    queue = deque([start])
+
+    remaining = None
+    if targets is not None:
+        remaining = set(targets)
+        remaining.discard(start)
+        if not remaining:
+            return dist
+
+    while queue:
+        node = queue.popleft()
+        d = dist[node] + 1
+        for i in range(offsets[node], offsets[node + 1]):
+            neighbor = neighbors[i]
+            if dist[neighbor] == -1:
+                dist[neighbor] = d
+                queue.append(neighbor)
+                if remaining is not None:
+                    remaining.discard(neighbor)
+                    if not remaining:
+                        return dist
+    return dist
+
+
+# Двунаправленный BFS: прямой поиск идёт по исходящим рёбрам от start,
+# обратный - по входящим рёбрам (кэшированный обратный CSR) от end.
+# На каждом шаге полностью раскрывается уровень меньшего фронта; после уровня,
+# на котором фронты встретились, выбирается вершина встречи с минимальной суммой расстояний.
+def bidirectional_bfs(graph, start, end):
+    if start == end:
+        return [start]
+
+    n = graph.num_vert
+    forward = graph.csr()
+    backward = graph.reverse_csr()
+    parent_f = array('i', [-1]) * n
+    parent_b = array('i', [-1]) * n
+    dist_f = array('i', [-1]) * n
+    dist_b = array('i', [-1]) * n
+    parent_f[start] = start
+    parent_b[end] = end
+    dist_f[start] = 0
+    dist_b[end] = 0
+    frontier_f = [start]
+    frontier_b = [end]
+
+    while frontier_f and frontier_b:
+        # Раскрываем меньший фронт
+        if len(frontier_f) <= len(frontier_b):
+            (offsets, neighbors), frontier = forward, frontier_f
+            parent, dist, other_dist = parent_f, dist_f, dist_b
+        else:
+            (offsets, neighbors), frontier = backward, frontier_b
+            parent, dist, other_dist = parent_b, dist_b, dist_f
+
+        next_frontier = []
+        meet, best = -1, -1
+        for node in frontier:
+            d = dist[node] + 1
+            for i in range(offsets[node], offsets[node + 1]):
+                neighbor = neighbors[i]
+                if dist[neighbor] == -1:
+                    dist[neighbor] = d
+                    parent[neighbor] = node
+                    next_frontier.append(neighbor)
+                    if other_dist[neighbor] != -1 and (best == -1 or d + other_dist[neighbor] < best):
+                        meet, best = neighbor, d + other_dist[neighbor]
+
+        if meet != -1:
+            path = restore_path(parent_f, start, meet)
+            while meet != end:
+                meet = parent_b[meet]
+                path.append(meet)
+            return path
+
+        if frontier is frontier_f:
+            frontier_f = next_frontier
+        else:
+            frontier_b = next_frontier
+    return None
+
+
 # Поиск в глубину (DFS)
 def dfs(graph, start, end, visited=None, path=None):
     if visited is None:
@@ -110,7 +513,9 @@ def dfs(graph, start, end, visited=None, path=None):
     if start == end:
         return path
 
-    for neighbor in graph.adjacency_list()[start]:
+    offsets, neighbors = graph.csr()
+    for i in range(offsets[start], offsets[start + 1]):
+        neighbor = neighbors[i]
         if neighbor not in visited:
             new_path = dfs(graph, neighbor, end, visited, path)
             if new_path:
@@ -118,6 +523,178 @@ def dfs(graph, start, end, visited=None, path=None):
     return None
 
 
+# События итеративного обхода в глубину
+DISCOVER = 'discover'  # вершина впервые посещена
+FINISH = 'finish'  # все потомки вершины обработаны
+BACK_EDGE = 'back'  # ребро в вершину, которая ещё находится в стеке (цикл)
+
+
+# Итеративный DFS по CSR-массивам с явным стеком вершин.
+# Для каждой вершины хранится только индекс следующего непросмотренного ребра,
+# поэтому память O(V) и глубина графа не ограничена лимитом рекурсии.
+# Выдаёт кортежи (событие, вершина, предок); для BACK_EDGE третий элемент -
+# вершина, из которой ведёт ребро. В неориентированном графе каждое ребро дерева
+# обхода видно и в обратную сторону, поэтому одно ребро в предка пропускается
+# (повторное ребро в предка - кратное ребро, т.е. настоящий цикл).
+def _dfs_events(offsets, neighbors, num_vert, sources, directed=True):
+    state = bytearray(num_vert)  # 0 - не посещена, 1 - в стеке, 2 - завершена
+    parent = array('i', [-1]) * num_vert
+    parent_edge_skipped = bytearray(num_vert)
+    pos = offsets[:-1]
+
+    for root in sources:
+        if state[root]:
+            continue
+        state[root] = 1
+        yield DISCOVER, root, -1
+        stack = [root]
+        while stack:
+            node = stack[-1]
+            i = pos[node]
+            if i < offsets[node + 1]:
+                pos[node] = i + 1
+                neighbor = neighbors[i]
+                if state[neighbor] == 0:
+                    state[neighbor] = 1
+                    parent[neighbor] = node
+                    stack.append(neighbor)
+                    yield DISCOVER, neighbor, node
+                elif state[neighbor] == 1:
+                    if not directed and neighbor == parent[node] and not parent_edge_skipped[node]:
+                        parent_edge_skipped[node] = 1
+                        continue
+                    yield BACK_EDGE, neighbor, node
+            else:
+                stack.pop()
+                state[node] = 2
+                yield FINISH, node, parent[node]
+
+
+# Генератор событий DFS по графу; sources - порядок стартовых вершин
+# (по умолчанию все вершины, т.е. обход всего леса)
+def dfs_events(graph, sources=None):
+    offsets, neighbors = graph.csr()
+    if sources is None:
+        sources = range(graph.num_vert)
+    return _dfs_events(offsets, neighbors, graph.num_vert, sources, graph.directed)
+
+
+# Итеративный поиск пути в глубину: путь восстанавливается по массиву предков
+def dfs_iterative(graph, start, end):
+    parent = array('i', [-1]) * graph.num_vert
+    for event, node, prev in dfs_events(graph, [start]):
+        if event == DISCOVER:
+            parent[node] = prev
+            if node == end:
+                return restore_path(parent, start, end)
+    return None
+
+
+# Топологическая сортировка ориентированного графа
+# (вершины в порядке убывания времени выхода); None, если в графе есть цикл
+def topological_sort(graph):
+    if not graph.directed:
+        raise ValueError("топологическая сортировка определена только для ориентированного графа")
+    order = []
+    for event, node, _ in dfs_events(graph):
+        if event == BACK_EDGE:
+            return None
+        if event == FINISH:
+            order.append(node)
+    order.reverse()
+    return order
+
+
+# Компоненты сильной связности (алгоритм Косарайю): второй проход DFS идёт
+# по обратному графу в порядке убывания времени выхода из первого прохода
+def strongly_connected_components(graph):
+    order = [node for event, node, _ in dfs_events(graph) if event == FINISH]
+    order.reverse()
+
+    offsets, neighbors = graph.reverse_csr()
+    components = []
+    for event, node, prev in _dfs_events(offsets, neighbors, graph.num_vert, order):
+        if event == DISCOVER:
+            if prev == -1:
+                components.append([])
+            components[-1].append(node)
+    return components
+
+
+# Пакетный BFS из нескольких источников сразу (multi-source BFS).
+# Для каждой вершины хранится битовая маска (целое число Python) источников,
+# уже достигших её; фронт - словарь {вершина: маска источников, впервые
+# достигших её на текущем уровне}. Одно ребро за уровень обрабатывает
+# сразу все источники пачки. Выдаёт тройки (уровень, вершина, маска).
+def _multi_source_bfs(offsets, neighbors, num_vert, sources):
+    seen = [0] * num_vert
+    frontier = {}
+    for b, source in enumerate(sources):
+        seen[source] |= 1 << b
+        frontier[source] = frontier.get(source, 0) | (1 << b)
+
+    level = 0
+    while frontier:
+        for node, mask in frontier.items():
+            yield level, node, mask
+        level += 1
+        next_frontier = {}
+        for node, mask in frontier.items():
+            for i in range(offsets[node], offsets[node + 1]):
+                neighbor = neighbors[i]
+                new = mask & ~seen[neighbor]
+                if new:
+                    seen[neighbor] |= new
+                    next_frontier[neighbor] = next_frontier.get(neighbor, 0) | new
+        frontier = next_frontier
+
+
+# Строки матрицы расстояний/достижимости, вычисляемые пачками по chunk_size
+# источников: в памяти одновременно находятся только строки текущей пачки.
+# Выдаёт пары (источник, строка); строка расстояний - array('i') с -1 для
+# недостижимых вершин, строка достижимости - bytearray из 0 и 1.
+def _batched_rows(graph, sources, chunk_size, distances):
+    offsets, neighbors = graph.csr()
+    n = graph.num_vert
+    if sources is None:
+        sources = range(n)
+    sources = list(sources)
+
+    for base in range(0, len(sources), chunk_size):
+        chunk = sources[base:base + chunk_size]
+        if distances:
+            rows = [array('i', [-1]) * n for _ in chunk]
+        else:
+            rows = [bytearray(n) for _ in chunk]
+        for level, node, mask in _multi_source_bfs(offsets, neighbors, n, chunk):
+            value = level if distances else 1
+            while mask:
+                low = mask & -mask
+                rows[low.bit_length() - 1][node] = value
+                mask ^= low
+        yield from zip(chunk, rows)
+
+
+# Построчная матрица расстояний (в рёбрах) для источников sources (по умолчанию все вершины)
+def distance_rows(graph, sources=None, chunk_size=256):
+    return _batched_rows(graph, sources, chunk_size, True)
+
+
+# Построчная матрица достижимости для источников sources (по умолчанию все вершины)
+def reachability_rows(graph, sources=None, chunk_size=256):
+    return _batched_rows(graph, sources, chunk_size, False)
+
+
+# Полная матрица расстояний V x V
+def distance_matrix(graph, chunk_size=256):
+    return [row for _, row in distance_rows(graph, chunk_size=chunk_size)]
+
+
+# Полная матрица достижимости V x V
+def reachability_matrix(graph, chunk_size=256):
+    return [row for _, row in reachability_rows(graph, chunk_size=chunk_size)]
+
+
 # Параметры для генерации графов
 min_ver = 10
 max_ver = 100
@@ -133,11 +710,11 @@ graph = generate_random_graph(min_ver, max_ver, min_edge, max_edge, max_degree,
 
 # Вывод информации о графе
 print("Матрица смежности:")
-for row in graph.adjacency_matrix():
+for row in graph.adjacency_rows():
     print(row)
 
 print("\nМатрица инцидентности:")
-for row in graph.incidence_matrix():
+for row in graph.incidence_rows():
     print(row)
 
 print("\nСписок смежности:")
@@ -147,16 +724,27 @@ for key, value in graph.adjacency_list().items():
 print("\nСписок ребер:")
 print(graph.edge_list())
 
+# Разреженное представление большого графа: плотные матрицы не создаются
+large_graph = generate_random_graph(2000, 2000, 4000, 4000, max_degree, directed)
+adj_rows, adj_cols = large_graph.adjacency_coo()
+inc_rows, inc_cols, inc_data = large_graph.incidence_coo()
+print(f"\nГраф {large_graph.num_vert} вершин, {len(large_graph.edges)} рёбер:")
+print(f"  матрица смежности: {len(adj_rows)} ненулевых из {large_graph.num_vert ** 2}")
+print(f"  матрица инцидентности: {len(inc_rows)} ненулевых из {large_graph.num_vert * len(large_graph.edges)}")
+
 # Списки для хранения результатов
 bfs_times = []
+bfs_parents_times = []
+bidirectional_times = []
 dfs_times = []
+dfs_iterative_times = []
 sizes = []
 
 # Генерация 10 графов с возрастающим количеством вершин и ребер
 for i in range(10):
     num_ver = 100 + i * 200
     num_edge = 100 + i * 400
-    graph = generate_random_graph(num_ver, num_ver, num_edge, num_edge, max_degree, directed)
+    graph = generate_random_graph(num_ver, num_ver, num_edge, num_edge, max_degree, directed, seed=i)
     sizes.append(num_ver)
 
     # Выбор случайных вершин для поиска пути
@@ -169,12 +757,27 @@ for i in range(10):
     bfs_time = time.time() - start_time
     bfs_times.append(bfs_time)
 
+    # Замер времени выполнения BFS с массивом предков
+    start_time = time.time()
+    bfs_parents_path = bfs_parents(graph, start, end)
+    bfs_parents_times.append(time.time() - start_time)
+
+    # Замер времени выполнения двунаправленного BFS
+    start_time = time.time()
+    bidirectional_path = bidirectional_bfs(graph, start, end)
+    bidirectional_times.append(time.time() - start_time)
+
     # Замер времени выполнения DFS
     start_time = time.time()
     dfs_path = dfs(graph, start, end)
     dfs_time = time.time() - start_time
     dfs_times.append(dfs_time)
 
+    # Замер времени выполнения итеративного DFS
+    start_time = time.time()
+    dfs_iterative_path = dfs_iterative(graph, start, end)
+    dfs_iterative_times.append(time.time() - start_time)
+
     # Вывод информации о графе и путях
     print(f"Граф {i + 1}:")
     print(f"Количество вершин: {num_ver}, Количество ребер: {num_edge}")
@@ -182,10 +785,73 @@ for i in range(10):
 
 # Построение графика
 plt.plot(sizes, bfs_times, label='BFS', marker='o')
+plt.plot(sizes, bfs_parents_times, label='BFS (массив предков)', marker='o')
+plt.plot(sizes, bidirectional_times, label='Двунаправленный BFS', marker='o')
 plt.plot(sizes, dfs_times, label='DFS', marker='o')
+plt.plot(sizes, dfs_iterative_times, label='DFS (итеративный)', marker='o')
 plt.xlabel('Количество вершин')
 plt.ylabel('Время (секунды)')
 plt.title('Сравнение времени выполнения BFS и DFS')
 plt.legend()
 plt.grid(True)
-plt.show()
\ No newline at end of file
+plt.show()
+
+# Проверка линейной зависимости времени обхода от размера графа:
+# конечная вершина недостижима (-1), поэтому BFS обходит всю достижимую часть графа
+scaling_sizes = []
+scaling_times = []
+for i in range(1, 11):
+    num_ver = 1000 * i
+    num_edge = 2 * num_ver
+    graph = generate_random_graph(num_ver, num_ver, num_edge, num_edge, max_degree, directed, seed=i)
+
+    start_time = time.time()
+    bfs(graph, 0, -1)
+    bfs_time = time.time() - start_time
+
+    scaling_sizes.append(num_ver + len(graph.edges))
+    scaling_times.append(bfs_time)
+    print(f"V = {num_ver}, E = {len(graph.edges)}: {bfs_time:.6f} с, "
+          f"{bfs_time / (num_ver + len(graph.edges)) * 1e6:.3f} мкс на вершину/ребро")
+
+plt.plot(scaling_sizes, scaling_times, label='BFS', marker='o')
+plt.xlabel('V + E')
+plt.ylabel('Время (секунды)')
+plt.title('Масштабирование полного обхода BFS')
+plt.legend()
+plt.grid(True)
+plt.show()
+
+# Итеративный DFS на графе-цепочке, где рекурсивная версия упирается в лимит рекурсии
+chain_size = 100000
+chain = Graph(chain_size, [(v, v + 1) for v in range(chain_size - 1)], directed=True)
+start_time = time.time()
+chain_path = dfs_iterative(chain, 0, chain_size - 1)
+print(f"\nЦепочка из {chain_size} вершин: длина пути DFS = {len(chain_path)}, "
+      f"время {time.time() - start_time:.6f} с")
+print(f"Топологическая сортировка цепочки корректна: {topological_sort(chain) == list(range(chain_size))}")
+
+
+# Сравнение пакетного вычисления матрицы расстояний с отдельным BFS из каждой вершины
+print()
+for num_ver in (250, 500, 1000, 2000):
+    graph = generate_random_graph(num_ver, num_ver, 2 * num_ver, 2 * num_ver, max_degree, directed)
+
+    start_time = time.time()
+    single = [bfs_distances(graph, source) for source in range(num_ver)]
+    single_time = time.time() - start_time
+
+    start_time = time.time()
+    batched = distance_matrix(graph)
+    batched_time = time.time() - start_time
+
+    print(f"Матрица расстояний {num_ver} x {num_ver}: BFS из каждой вершины {single_time:.3f} с, "
+          f"пакетный BFS {batched_time:.3f} с, совпадает: {single == batched}")
+
+
+# Время генерации графов с миллионом рёбер (ровно заданное число рёбер)
+print()
+for generator in (generate_random_graph, generate_random_graph_numpy):
+    start_time = time.time()
+    graph = generator(500000, 500000, 1000000, 1000000, max_degree, directed=False, seed=0)
+    print(f"{generator.__name__}: {len(graph.edges)} рёбер за {time.time() - start_time:.3f} с")
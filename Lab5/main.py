@@ -1,13 +1,422 @@
 import random
 import time
+import tracemalloc
+from array import array
+from bisect import bisect_left, insort
+from heapq import heapify, heappush, heappop
+import numpy as np
 import matplotlib.pyplot as plt
 
+# Система непересекающихся множеств на массивах:
+# сжатие путей делением пополам (path halving) и объединение по размеру,
+# поэтому find работает за почти константное амортизированное время без рекурсии
+class DisjointSet:
+    def __init__(self, n):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+        self.count = n  # Количество множеств
+
+    # Поиск корня множества с сокращением пути
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    # Объединение множеств; возвращает False, если x и y уже в одном множестве
+    def union(self, x, y):
+        x = self.find(x)
+        y = self.find(y)
+        if x == y:
+            return False
+
+        # Присоединяем меньшее дерево к большему
+        if self.size[x] < self.size[y]:
+            x, y = y, x
+        self.parent[y] = x
+        self.size[x] += self.size[y]
+        self.count -= 1
+        return True
+
+
+# Двоичная куча вершин с ключами и операцией уменьшения ключа за O(log n).
+# Позиция каждой вершины в куче хранится в массиве pos (-1 - вершины нет в куче)
+class IndexedHeap:
+    def __init__(self, n):
+        self.heap = array('i')
+        self.pos = array('i', [-1]) * n
+        self.keys = [0] * n
+
+    def __len__(self):
+        return len(self.heap)
+
+    # Добавление вершины или уменьшение её ключа; True, если ключ изменился
+    def push_or_decrease(self, v, key):
+        if self.pos[v] == -1:
+            self.heap.append(v)
+            self.pos[v] = len(self.heap) - 1
+        elif key >= self.keys[v]:
+            return False
+        self.keys[v] = key
+        self._sift_up(self.pos[v])
+        return True
+
+    # Извлечение вершины с минимальным ключом: пара (вершина, ключ)
+    def pop(self):
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        self.pos[top] = -1
+        if heap:
+            heap[0] = last
+            self.pos[last] = 0
+            self._sift_down(0)
+        return top, self.keys[top]
+
+    def _sift_up(self, i):
+        heap, pos, keys = self.heap, self.pos, self.keys
+        v = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if keys[heap[parent]] <= keys[v]:
+                break
+            heap[i] = heap[parent]
+            pos[heap[i]] = i
+            i = parent
+        heap[i] = v
+        pos[v] = i
+
+    def _sift_down(self, i):
+        heap, pos, keys = self.heap, self.pos, self.keys
+        n = len(heap)
+        v = heap[i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and keys[heap[child + 1]] < keys[heap[child]]:
+                child += 1
+            if keys[v] <= keys[heap[child]]:
+                break
+            heap[i] = heap[child]
+            pos[heap[i]] = i
+            i = child
+        heap[i] = v
+        pos[v] = i
+
+
+# Компактное хранение рёбер взвешенного графа: концы и веса лежат в трёх массивах
+# array ('i' - 4 байта на элемент), т.е. около 12 байт на ребро вместо ~80+ байт
+# на кортеж (u, v, w) в списке. Ведёт себя как последовательность кортежей
+# (u, v, w), поэтому передаётся в Graph вместо списка рёбер без изменения API
+class EdgeColumns:
+    def __init__(self, u=(), v=(), w=(), weight_type='i'):
+        self.u = array('i', u)
+        self.v = array('i', v)
+        self.w = array(weight_type, w)
+
+    # Из списка кортежей (u, v, w)
+    @classmethod
+    def from_edges(cls, edges, weight_type='i'):
+        columns = cls(weight_type=weight_type)
+        for edge in edges:
+            columns.append(edge)
+        return columns
+
+    # Из трёх массивов numpy без поэлементного обхода
+    @classmethod
+    def from_numpy(cls, u, v, w, weight_type='i'):
+        return cls(array('i', u.astype(np.int32).tobytes()),
+                   array('i', v.astype(np.int32).tobytes()),
+                   array(weight_type, w.astype(weight_type).tobytes()),
+                   weight_type)
+
+    def __len__(self):
+        return len(self.u)
+
+    def __getitem__(self, i):
+        return self.u[i], self.v[i], self.w[i]
+
+    def __setitem__(self, i, edge):
+        self.u[i], self.v[i], self.w[i] = edge
+
+    def __iter__(self):
+        return zip(self.u, self.v, self.w)
+
+    def append(self, edge):
+        u, v, w = edge
+        self.u.append(u)
+        self.v.append(v)
+        self.w.append(w)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
 # Класс графа
 class Graph:
     def __init__(self, num_vert, edges):
         self.num_vert = num_vert
         self.edges = edges
 
+    # Список рёбер хранится через свойство, чтобы при его замене сбрасывался кэш смежности
+    @property
+    def edges(self):
+        return self._edges
+
+    @edges.setter
+    def edges(self, edges):
+        self._edges = edges
+        self.invalidate()
+
+    # Сброс кэша (нужно вызвать вручную, если список рёбер изменён напрямую)
+    def invalidate(self):
+        self._csr = None
+        self._order = None
+        self._mst = None  # Индекс ребра остова -> позиция в _mst_edges
+        self._mst_edges = None  # Рёбра остова (результат current_mst)
+        self._mst_adj = None  # Смежность остова: вершина -> {индекс ребра: сосед}
+        self._incidence = None  # Вершина -> индексы инцидентных рёбер
+
+    # Ключ сортировки ребра: вес, при равенстве - индекс (как при устойчивой сортировке)
+    def _order_key(self, i):
+        return self._edges[i][2], i
+
+    # Индексы рёбер, упорядоченные по весу. Строится один раз и далее
+    # поддерживается при add_edge/set_weight без полной пересортировки.
+    # Для малых целых весов автоматически выбирается сортировка по корзинам
+    def sorted_order(self):
+        if self._order is None:
+            order = self._bucket_order()
+            self._order = order if order is not None else self._comparison_order()
+        return self._order
+
+    # Веса рёбер в виде массива numpy (для столбцового хранения - без обхода кортежей)
+    def _weight_array(self):
+        if isinstance(self._edges, EdgeColumns):
+            return np.array(self._edges.w)
+        return np.array([w for _, _, w in self._edges])
+
+    # Концы рёбер в виде двух массивов numpy
+    def _endpoint_arrays(self):
+        if isinstance(self._edges, EdgeColumns):
+            return np.array(self._edges.u, dtype=np.int64), np.array(self._edges.v, dtype=np.int64)
+        num_edges = len(self._edges)
+        return (np.fromiter((u for u, _, _ in self._edges), np.int64, num_edges),
+                np.fromiter((v for _, v, _ in self._edges), np.int64, num_edges))
+
+    # Упорядочение сортировкой сравнениями, O(E log E)
+    def _comparison_order(self):
+        order = np.argsort(self._weight_array(), kind='stable')
+        return array('i', order.astype(np.int32).tobytes())
+
+    # Упорядочение по корзинам для целых весов из диапазона не больше BUCKET_MAX_RANGE:
+    # веса сдвигаются к нулю и приводятся к 16-битным целым, для которых устойчивая
+    # сортировка numpy выполняется поразрядно (radix sort) за O(E + W) без сравнений.
+    # Возвращает None, если веса не целые или диапазон слишком велик
+    def _bucket_order(self):
+        weights = self._weight_array()
+        if weights.size == 0:
+            return array('i')
+        if weights.dtype.kind not in 'iu':
+            return None
+        low = weights.min()
+        if weights.max() - low >= BUCKET_MAX_RANGE:
+            return None
+        order = np.argsort((weights - low).astype(np.uint16), kind='stable')
+        return array('i', order.astype(np.int32).tobytes())
+
+    # Добавление ребра: вставка в упорядоченный индекс бинарным поиском
+    # и обновление поддерживаемого остова, если он уже построен
+    def add_edge(self, u, v, w):
+        self._edges.append((u, v, w))
+        i = len(self._edges) - 1
+        self._csr = None
+        if self._order is not None:
+            insort(self._order, i, key=self._order_key)
+        if self._incidence is not None:
+            self._incidence[u].append(i)
+            if v != u:
+                self._incidence[v].append(i)
+        if self._mst is not None:
+            self._mst_edge_improved(i)
+
+    # Изменение веса ребра с индексом i
+    def set_weight(self, i, w):
+        u, v, old_w = self._edges[i]
+        if self._order is not None:
+            del self._order[bisect_left(self._order, self._order_key(i), key=self._order_key)]
+        self._edges[i] = (u, v, w)
+        self._csr = None
+        if self._order is not None:
+            insort(self._order, i, key=self._order_key)
+
+        if self._mst is not None:
+            if i in self._mst:
+                self._mst_edges[self._mst[i]] = (u, v, w)
+                if w > old_w:
+                    self._mst_edge_worsened(i)
+            elif w < old_w:
+                self._mst_edge_improved(i)
+
+    # Текущее минимальное остовное дерево (лес). Строится алгоритмом Краскала
+    # один раз, а затем поддерживается инкрементально при изменении отдельных рёбер.
+    # Возвращается поддерживаемый список рёбер без копирования - его нельзя изменять
+    def current_mst(self):
+        if self._mst is None:
+            self.kruskal()
+        return self._mst_edges
+
+    # Смежность остова: вершина -> {индекс ребра: сосед}. Строится при первом
+    # инкрементальном обновлении и далее изменяется на месте при замене рёбер
+    def _mst_adjacency(self):
+        if self._mst_adj is None:
+            adj = {}
+            for i in self._mst:
+                u, v, _ = self._edges[i]
+                adj.setdefault(u, {})[i] = v
+                adj.setdefault(v, {})[i] = u
+            self._mst_adj = adj
+        return self._mst_adj
+
+    # Индексы рёбер, инцидентных каждой вершине (не зависят от весов,
+    # поэтому сохраняются при set_weight и дополняются в add_edge)
+    def _incident_edges(self):
+        if self._incidence is None:
+            incidence = [[] for _ in range(self.num_vert)]
+            for i, (u, v, _) in enumerate(self._edges):
+                incidence[u].append(i)
+                if v != u:
+                    incidence[v].append(i)
+            self._incidence = incidence
+        return self._incidence
+
+    # Добавление ребра i в остов (соединяет два дерева леса)
+    def _mst_link(self, i):
+        u, v, _ = self._edges[i]
+        self._mst[i] = len(self._mst_edges)
+        self._mst_edges.append(self._edges[i])
+        adj = self._mst_adjacency()
+        adj.setdefault(u, {})[i] = v
+        adj.setdefault(v, {})[i] = u
+
+    # Замена ребра old остова ребром new: позиция в списке рёбер сохраняется
+    def _mst_swap(self, old, new):
+        position = self._mst.pop(old)
+        self._mst[new] = position
+        self._mst_edges[position] = self._edges[new]
+        adj = self._mst_adjacency()
+        u, v, _ = self._edges[old]
+        del adj[u][old]
+        del adj[v][old]
+        u, v, _ = self._edges[new]
+        adj.setdefault(u, {})[new] = v
+        adj.setdefault(v, {})[new] = u
+
+    # Ребро i не в остове стало легче (или добавлено): если оно замыкает цикл
+    # с более тяжёлым ребром остова, заменяем самое тяжёлое ребро цикла.
+    # Путь u-v ищется обходом в ширину одновременно от обоих концов до встречи
+    def _mst_edge_improved(self, i):
+        u, v, w = self._edges[i]
+        if u == v:
+            return
+        adj = self._mst_adjacency()
+
+        # parents[k]: вершина -> (предок, индекс ребра) в обходе от u (k = 0) и от v (k = 1)
+        parents = ({u: (u, -1)}, {v: (v, -1)})
+        frontiers = ([u], [v])
+        meeting = None
+        while meeting is None and frontiers[0] and frontiers[1]:
+            # Расширяем меньший фронт на один уровень
+            k = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            parent, other = parents[k], parents[1 - k]
+            next_frontier = []
+            for node in frontiers[k]:
+                for j, neighbor in adj.get(node, {}).items():
+                    if neighbor not in parent:
+                        parent[neighbor] = (node, j)
+                        if neighbor in other:
+                            meeting = neighbor
+                            break
+                        next_frontier.append(neighbor)
+                if meeting is not None:
+                    break
+            frontiers[k][:] = next_frontier
+
+        if meeting is None:  # u и v в разных деревьях леса
+            self._mst_link(i)
+            return
+
+        heaviest = -1
+        for parent in parents:
+            node = meeting
+            while parent[node][1] != -1:
+                node, j = parent[node]
+                if heaviest == -1 or self._order_key(j) > self._order_key(heaviest):
+                    heaviest = j
+        if self._order_key(i) < self._order_key(heaviest):
+            self._mst_swap(heaviest, i)
+
+    # Ребро i остова стало тяжелее: без него дерево распадается на две части.
+    # Меньшая часть находится обходом от обоих концов по очереди (до исчерпания
+    # одного из них), и самое лёгкое ребро между частями (возможно, само i)
+    # ищется только среди рёбер, инцидентных меньшей части
+    def _mst_edge_worsened(self, i):
+        u, v, _ = self._edges[i]
+        adj = self._mst_adjacency()
+
+        sides = ({u}, {v})
+        stacks = ([u], [v])
+        while stacks[0] and stacks[1]:
+            for side, stack in zip(sides, stacks):
+                node = stack.pop()
+                for j, neighbor in adj.get(node, {}).items():
+                    if j != i and neighbor not in side:
+                        side.add(neighbor)
+                        stack.append(neighbor)
+        side = sides[0] if not stacks[0] else sides[1]
+
+        incidence = self._incident_edges()
+        edges = self._edges
+        best = i
+        best_key = self._order_key(i)
+        for node in side:
+            for j in incidence[node]:
+                a, b, weight = edges[j]
+                if (a in side) != (b in side) and (weight, j) < best_key:
+                    best, best_key = j, (weight, j)
+        if best != i:
+            self._mst_swap(i, best)
+
+    # Кэшированный список смежности в формате CSR: соседи вершины v и веса
+    # соответствующих рёбер лежат в neighbors/weights[offsets[v]:offsets[v + 1]]
+    def csr(self):
+        if self._csr is None:
+            n = self.num_vert
+            offsets = array('i', [0]) * (n + 1)
+            for u, v, _ in self._edges:
+                offsets[u + 1] += 1
+                offsets[v + 1] += 1
+            for i in range(n):
+                offsets[i + 1] += offsets[i]
+
+            neighbors = array('i', [0]) * offsets[n]
+            if isinstance(self._edges, EdgeColumns):
+                weights = array(self._edges.w.typecode, [0]) * offsets[n]
+            else:
+                weights = [0] * offsets[n]
+            pos = offsets[:-1]
+            for u, v, w in self._edges:
+                neighbors[pos[u]] = v
+                weights[pos[u]] = w
+                pos[u] += 1
+                neighbors[pos[v]] = u
+                weights[pos[v]] = w
+                pos[v] += 1
+            self._csr = (offsets, neighbors, weights)
+        return self._csr
+
     # Матрица смежности
     def adjacency_matrix(self):
         matrix = [[0] * self.num_vert for _ in range(self.num_vert)]
@@ -28,88 +437,236 @@ class Graph:
     def edge_list(self):
         return self.edges
 
-    # Функция для поиска минимального остовного дерева (алгоритм Краскала)
-    def kruskal(self):
-        # Вспомогательная функция для нахождения корня множества
-        def find(parent, i):
-            if parent[i] == i:
-                return i
-            return find(parent, parent[i])
-
-        # Вспомогательная функция для объединения двух множеств
-        def union(parent, rank, x, y):
-            xroot = find(parent, x)
-            yroot = find(parent, y)
-
-            # Присоединяем меньшее дерево к большему
-            if rank[xroot] < rank[yroot]:
-                parent[xroot] = yroot
-            elif rank[xroot] > rank[yroot]:
-                parent[yroot] = xroot
-            else:
-                parent[yroot] = xroot
-                rank[xroot] += 1
-
+    # Функция для поиска минимального остовного дерева (алгоритм Краскала).
+    # Граф не изменяется: используется кэшированный упорядоченный индекс рёбер.
+    # sort='bucket' или 'comparison' принудительно заново упорядочивает рёбра
+    # выбранным способом без кэширования (для сравнения способов сортировки)
+    def kruskal(self, sort='auto'):
         # Результирующее минимальное остовное дерево
         result = []
+        mst = {}  # Индекс ребра -> позиция в result
+
+        # Шаг 1: Берём рёбра в порядке возрастания веса (индекс сортируется один раз)
+        if sort == 'auto':
+            order = self.sorted_order()
+        elif sort == 'bucket':
+            order = self._bucket_order()
+            if order is None:
+                raise ValueError(f"сортировка по корзинам требует целых весов с диапазоном меньше {BUCKET_MAX_RANGE}")
+        elif sort == 'comparison':
+            order = self._comparison_order()
+        else:
+            raise ValueError(f"неизвестный способ сортировки рёбер: {sort!r}")
+
+        # Каждая вершина - отдельное множество
+        dsu = DisjointSet(self.num_vert)
 
-        # Индекс для сортированных рёбер
-        i = 0
-        # Индекс для результата
-        e = 0
-
-        # Шаг 1: Сортируем все рёбра по весу
-        self.edges = sorted(self.edges, key=lambda item: item[2])
+        # Шаг 2: Проходим по всем рёбрам и добавляем их в дерево, если они не образуют цикл
+        edges = self._edges
+        for i in order:
+            u, v, w = edges[i]
+            if dsu.union(u, v):
+                mst[i] = len(result)
+                result.append((u, v, w))
+                if len(result) == self.num_vert - 1:
+                    break
 
-        parent = []
-        rank = []
+        self._mst = mst
+        self._mst_edges = list(result)
+        self._mst_adj = None
+        return result
 
-        # Создаём подмножества для каждой вершины
-        for node in range(self.num_vert):
-            parent.append(node)
-            rank.append(0)
+    # Алгоритм Прима с "ленивой" кучей рёбер: в кучу кладутся все рёбра к вершинам
+    # вне дерева, устаревшие записи пропускаются при извлечении. O(E log E)
+    def prim(self):
+        offsets, neighbors, weights = self.csr()
+        in_tree = bytearray(self.num_vert)
+        result = []
 
-        # Шаг 2: Проходим по всем рёбрам и добавляем их в дерево, если они не образуют цикл
-        while e < self.num_vert - 1:
-            u, v, w = self.edges[i]
-            i += 1
-            x = find(parent, u)
-            y = find(parent, v)
-
-            # Если ребро не образует цикл, добавляем его в результат
-            if x != y:
-                e += 1
+        # Перебор корней нужен, чтобы для несвязного графа построить остовный лес
+        for root in range(self.num_vert):
+            if in_tree[root]:
+                continue
+            in_tree[root] = 1
+            heap = [(weights[i], neighbors[i], root) for i in range(offsets[root], offsets[root + 1])]
+            heapify(heap)
+
+            while heap:
+                w, v, u = heappop(heap)
+                if in_tree[v]:
+                    continue
+                in_tree[v] = 1
                 result.append((u, v, w))
-                union(parent, rank, x, y)
+                for i in range(offsets[v], offsets[v + 1]):
+                    if not in_tree[neighbors[i]]:
+                        heappush(heap, (weights[i], neighbors[i], v))
 
         return result
 
+    # Алгоритм Прима с индексированной кучей вершин: для каждой вершины вне дерева
+    # хранится лучший известный вес ребра, который уменьшается (decrease-key). O(E log V)
+    def prim_indexed(self):
+        offsets, neighbors, weights = self.csr()
+        in_tree = bytearray(self.num_vert)
+        parent = array('i', [-1]) * self.num_vert
+        heap = IndexedHeap(self.num_vert)
+        result = []
+
+        for root in range(self.num_vert):
+            if in_tree[root]:
+                continue
+            heap.push_or_decrease(root, 0)
+
+            while heap:
+                u, w = heap.pop()
+                in_tree[u] = 1
+                if parent[u] != -1:
+                    result.append((parent[u], u, w))
+                for i in range(offsets[u], offsets[u + 1]):
+                    v = neighbors[i]
+                    if not in_tree[v] and heap.push_or_decrease(v, weights[i]):
+                        parent[v] = u
+
+        return result
+
+    # Алгоритм Борувки, векторизованный numpy. В каждом раунде для всех компонент
+    # одновременно находится самое дешёвое исходящее ребро (np.minimum.at по концам
+    # рёбер, т.е. минимум с группировкой по компоненте), затем компоненты стягиваются
+    # вдоль выбранных рёбер скачками указателей. Раундов O(log V).
+    # Равные веса упорядочиваются по индексу ребра, поэтому циклы не возникают.
+    # Ускорение однопоточное: циклы по рёбрам выполняет numpy (np.minimum.at
+    # работает на одном ядре), распараллеливания по ядрам здесь нет
+    def boruvka(self):
+        n = self.num_vert
+        num_edges = len(self._edges)
+        if num_edges == 0:
+            return []
+        all_u, all_v = self._endpoint_arrays()
+        weights = self._weight_array()
+
+        # Ранг ребра - позиция в порядке (вес, индекс); сравниваем ранги вместо весов
+        order = np.argsort(weights, kind='stable')
+        rank = np.empty_like(order)
+        rank[order] = np.arange(num_edges)
+
+        comp = np.arange(n)  # Метка компоненты для каждой вершины
+        edge_u, edge_v, edge_rank = all_u, all_v, rank
+        in_mst = np.zeros(num_edges, dtype=bool)
+
+        while True:
+            # Отбрасываем рёбра внутри компонент
+            cu = comp[edge_u]
+            cv = comp[edge_v]
+            outer = cu != cv
+            edge_u, edge_v, edge_rank = edge_u[outer], edge_v[outer], edge_rank[outer]
+            if edge_rank.size == 0:
+                break
+            cu, cv = cu[outer], cv[outer]
+
+            # Самое дешёвое ребро для каждой компоненты
+            best = np.full(n, num_edges)
+            np.minimum.at(best, cu, edge_rank)
+            np.minimum.at(best, cv, edge_rank)
+            comps = np.flatnonzero(best < num_edges)
+            cheapest = order[best[comps]]
+            in_mst[cheapest] = True
+
+            # Каждая компонента указывает на компоненту на другом конце своего ребра;
+            # взаимные пары (обе выбрали одно ребро) разрываем в пользу меньшей метки
+            a = comp[all_u[cheapest]]
+            b = comp[all_v[cheapest]]
+            other = np.where(a == comps, b, a)
+            pointer = np.arange(n)
+            pointer[comps] = other
+            root = (pointer[other] == comps) & (comps < other)
+            pointer[comps[root]] = comps[root]
+
+            # Скачки указателей до корней и стягивание компонент
+            while True:
+                jumped = pointer[pointer]
+                if np.array_equal(jumped, pointer):
+                    break
+                pointer = jumped
+            comp = pointer[comp]
+
+        return [self._edges[i] for i in np.flatnonzero(in_mst).tolist()]
+
+    # Минимальное остовное дерево выбранным методом
+    def mst(self, method='kruskal'):
+        if method not in MST_METHODS:
+            raise ValueError(f"неизвестный метод построения остова: {method!r}, доступны: {', '.join(MST_METHODS)}")
+        return getattr(self, method)()
+
+
+# Доступные методы построения минимального остовного дерева
+MST_METHODS = ('kruskal', 'prim', 'prim_indexed', 'boruvka')
+
+# Максимальный диапазон целых весов, при котором рёбра сортируются по корзинам
+BUCKET_MAX_RANGE = 1 << 16
+
 
 # Функция для создания связного взвешенного ненаправленного графа
 def create_graph(num_vertices, min_edges, max_weight=20):
     edges = []  # Список рёбер
+    edge_keys = set()  # Нормализованные пары (min, max) для проверки дубликатов за O(1)
+    degree = [0] * num_vertices
 
     # Создаём граф - цепь
     for i in range(1, num_vertices):
         weight = random.randint(1, max_weight)
         edges.append((i - 1, i, weight))
+        edge_keys.add((i - 1, i))
+        degree[i - 1] += 1
+        degree[i] += 1
 
     # Добавляем к каждой вершине оставшиеся случайные рёбра
     for i in range(num_vertices):
         # Уже есть одно ребро в цепочке (кроме первой и последней вершины)
         remaining_edges = min_edges - 2 if i not in (0, num_vertices - 1) else min_edges - 1
 
-        # Добавляем случайные рёбра
-        while remaining_edges > 0:
+        # Добавляем случайные рёбра (пока у вершины есть с кем соединиться)
+        while remaining_edges > 0 and degree[i] < num_vertices - 1:
             j = random.randint(0, num_vertices - 1)
-            if j != i and (i, j) not in edges and (j, i) not in edges:  # Исключаем петли и дубликаты
+            key = (i, j) if i < j else (j, i)
+            if j != i and key not in edge_keys:  # Исключаем петли и дубликаты
                 weight = random.randint(1, max_weight)
                 edges.append((i, j, weight))
+                edge_keys.add(key)
+                degree[i] += 1
+                degree[j] += 1
                 remaining_edges -= 1
 
     return Graph(num_vertices, edges)
 
 
+# Векторизованное создание больших связных взвешенных графов (миллионы рёбер за секунды).
+# Как и create_graph: цепочка 0-1-...-(n-1) плюс min_edges - 1 случайных рёбер от каждой вершины.
+# Петли отбрасываются, дубликаты удаляются через np.unique по ключу min * n + max,
+# поэтому случайных рёбер может получиться немного меньше запрошенного.
+# compact=True сохраняет рёбра в столбцовом виде (EdgeColumns).
+def create_graph_numpy(num_vertices, min_edges, max_weight=20, seed=None, compact=False):
+    rng = np.random.default_rng(seed)
+    n = num_vertices
+
+    chain = np.arange(n - 1)
+    extra = max(min_edges - 1, 0)
+    u = np.concatenate((chain, np.repeat(np.arange(n), extra)))
+    v = np.concatenate((chain + 1, rng.integers(0, n, n * extra)))
+
+    # Отбрасываем петли и оставляем первое вхождение каждого ребра (цепочка идёт первой)
+    keep = u != v
+    u, v = u[keep], v[keep]
+    keys = np.minimum(u, v) * n + np.maximum(u, v)
+    _, first = np.unique(keys, return_index=True)
+    first.sort()
+    u, v = u[first], v[first]
+    w = rng.integers(1, max_weight, len(u), endpoint=True)
+
+    if compact:
+        return Graph(n, EdgeColumns.from_numpy(u, v, w))
+    return Graph(n, list(zip(u.tolist(), v.tolist(), w.tolist())))
+
+
 # Параметры для создания графов
 num_vertices_list = [10, 20, 50, 100]  # Количество вершин
 min_edges_list = [3, 4, 10, 20]  # Минимальное количество рёбер на вершину
@@ -122,41 +679,152 @@ for mat in matrix:
     print(mat)
 
 # Выполнение тестов
+# Время для наибольшего графа при каждой плотности (для сравнения методов по плотности)
+density_times = {method: [] for method in MST_METHODS}
+
 for min_edges in min_edges_list:
     # Списки для хранения результатов
-    average_execution_times = []
+    average_execution_times = {method: [] for method in MST_METHODS}
     sizes = []
     print(f"\nТестирование графа с минимум {min_edges} рёбрами:")
     for num_vertices in num_vertices_list:
         print(f"\nТестирование графа с {num_vertices} вершинами:")
-        execution_times = []
+        execution_times = {method: [] for method in MST_METHODS}
 
         for test in range(num_tests):
             # Создаём граф
             graph = create_graph(num_vertices, min_edges, max_weight)
 
-            # Замер времени выполнения алгоритма Краскала
-            start_time = time.time()
-            mst = graph.kruskal()
-            end_time = time.time()
+            # Замер времени выполнения каждого алгоритма на одном и том же графе
+            for method in MST_METHODS:
+                start_time = time.time()
+                mst = graph.mst(method)
+                end_time = time.time()
 
-            execution_time = end_time - start_time
-            execution_times.append(execution_time)
+                execution_time = end_time - start_time
+                execution_times[method].append(execution_time)
 
-            print(f"Тест {test + 1}: Время выполнения = {execution_time:.6f} секунд")
+            print(f"Тест {test + 1}: Время выполнения = " +
+                  ", ".join(f"{method} {execution_times[method][-1]:.6f}" for method in MST_METHODS) + " секунд")
 
         # Усредняем результаты
-        average_time = sum(execution_times) / num_tests
-        average_execution_times.append(average_time)
+        for method in MST_METHODS:
+            average_time = sum(execution_times[method]) / num_tests
+            average_execution_times[method].append(average_time)
+            print(f"Среднее время выполнения {method} для {num_vertices} вершин: {average_time:.6f} секунд")
         sizes.append(num_vertices)
 
-        print(f"Среднее время выполнения для {num_vertices} вершин: {average_time:.6f} секунд")
+    for method in MST_METHODS:
+        density_times[method].append(average_execution_times[method][-1])
 
     # Построение графика
     plt.figure(figsize=(10, 6))
-    plt.plot(sizes, average_execution_times, marker='o', linestyle='-', color='b')
-    plt.title(f"Зависимость времени выполнения алгоритма Краскала \nот количества вершин c минимум {min_edges} рёбер у каждой вершины")
+    for method in MST_METHODS:
+        plt.plot(sizes, average_execution_times[method], marker='o', linestyle='-', label=method)
+    plt.title(f"Зависимость времени построения остова \nот количества вершин c минимум {min_edges} рёбер у каждой вершины")
     plt.xlabel("Количество вершин (N)")
     plt.ylabel("Среднее время выполнения (секунды)")
+    plt.legend()
     plt.grid(True)
-    plt.show()
\ No newline at end of file
+    plt.show()
+
+# Сравнение методов в зависимости от плотности графа
+plt.figure(figsize=(10, 6))
+for method in MST_METHODS:
+    plt.plot(min_edges_list, density_times[method], marker='o', linestyle='-', label=method)
+plt.title(f"Время построения остова для {num_vertices_list[-1]} вершин в зависимости от плотности графа")
+plt.xlabel("Минимальное количество рёбер у вершины")
+plt.ylabel("Среднее время выполнения (секунды)")
+plt.legend()
+plt.grid(True)
+plt.show()
+
+# Алгоритм Краскала на больших разреженных графах (10^5 - 10^6 вершин),
+# созданных векторизованным генератором; время в пересчёте на ребро
+# должно оставаться почти постоянным
+print("\nКраскал на больших графах:")
+for num_vertices in (100000, 300000, 1000000):
+    start_time = time.time()
+    graph = create_graph_numpy(num_vertices, 3, max_weight)
+    creation_time = time.time() - start_time
+
+    start_time = time.time()
+    mst = graph.kruskal()
+    execution_time = time.time() - start_time
+    print(f"{num_vertices} вершин, {len(graph.edges)} рёбер: создание {creation_time:.3f} секунд, "
+          f"Краскал {execution_time:.3f} секунд, {execution_time / len(graph.edges) * 1e6:.3f} мкс на ребро")
+
+
+# Повторное построение остова после изменения веса одного ребра:
+# полный пересчёт Краскалом против инкрементального обновления current_mst
+print("\nОбновление остова при изменении весов отдельных рёбер:")
+graph = create_graph_numpy(20000, 5, max_weight, seed=0)
+num_updates = 100
+updates = [(random.randrange(len(graph.edges)), random.randint(1, max_weight)) for _ in range(num_updates)]
+graph.current_mst()
+
+full_time = 0
+incremental_time = 0
+for i, w in updates:
+    start_time = time.time()
+    graph.set_weight(i, w)
+    incremental_mst = graph.current_mst()
+    incremental_time += time.time() - start_time
+
+    start_time = time.time()
+    full_mst = Graph(graph.num_vert, list(graph.edges)).kruskal()
+    full_time += time.time() - start_time
+
+    assert sum(e[2] for e in incremental_mst) == sum(e[2] for e in full_mst)
+
+print(f"{graph.num_vert} вершин, {len(graph.edges)} рёбер, {num_updates} изменений: "
+      f"полный пересчёт {full_time / num_updates:.6f} секунд, "
+      f"инкрементально {incremental_time / num_updates:.6f} секунд на изменение")
+
+
+# Краскал с сортировкой рёбер по корзинам (малые целые веса 1..max_weight)
+# против сортировки сравнениями: полное время и время одной только сортировки
+print("\nСортировка рёбер в алгоритме Краскала:")
+for num_vertices in (100000, 300000, 1000000):
+    graph = create_graph_numpy(num_vertices, 3, max_weight)
+    for sort, order_function in (('comparison', graph._comparison_order), ('bucket', graph._bucket_order)):
+        start_time = time.time()
+        mst = graph.kruskal(sort=sort)
+        kruskal_time = time.time() - start_time
+
+        start_time = time.time()
+        order_function()
+        sort_time = time.time() - start_time
+        print(f"{num_vertices} вершин, {len(graph.edges)} рёбер, {sort}: Краскал {kruskal_time:.3f} секунд, "
+              f"сортировка отдельно {sort_time:.3f} секунд")
+
+
+# Векторизованный алгоритм Борувки против Краскала на больших графах
+print("\nБорувка против Краскала на больших графах:")
+for num_vertices in (100000, 300000, 1000000):
+    graph = create_graph_numpy(num_vertices, 3, max_weight)
+    times = {}
+    weights = {}
+    for method in ('kruskal', 'boruvka'):
+        start_time = time.time()
+        mst = graph.mst(method)
+        times[method] = time.time() - start_time
+        weights[method] = sum(w for _, _, w in mst)
+    print(f"{num_vertices} вершин, {len(graph.edges)} рёбер: Краскал {times['kruskal']:.3f} секунд, "
+          f"Борувка {times['boruvka']:.3f} секунд, веса остовов совпадают: {weights['kruskal'] == weights['boruvka']}")
+
+
+# Память на хранение рёбер: список кортежей против столбцов EdgeColumns
+print("\nПамять на хранение рёбер:")
+for compact in (False, True):
+    tracemalloc.start()
+    graph = create_graph_numpy(1000000, 3, max_weight, seed=0, compact=compact)
+    edges_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start_time = time.time()
+    mst = graph.kruskal()
+    execution_time = time.time() - start_time
+    print(f"{'EdgeColumns' if compact else 'список кортежей'}: {len(graph.edges)} рёбер, "
+          f"{edges_memory / len(graph.edges):.1f} байт на ребро, Краскал {execution_time:.3f} секунд, "
+          f"вес остова {sum(w for _, _, w in mst)}")
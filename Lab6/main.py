@@ -1,260 +1,293 @@
+import os
+import sys
 import time
 import random
+import bisect
+import tracemalloc
+from array import array as typed_array
+from concurrent.futures import ProcessPoolExecutor
 import matplotlib.pyplot as plt
-import sys
 from statistics import mean
 
-"""
-Класс Node представляет узел дерева с ключом и указателями на левого/правого потомка.
-Для AVL-дерева также хранится высота поддерева.
-"""
-
-
-class Node:
-    def __init__(self, key):
-        self.key = key  # Значение узла
-        self.left = None  # Левый потомок
-        self.right = None  # Правый потомок
-        self.height = 1  # Высота поддерева (для AVL)
+# Деревья BST, AVL и Treap берутся из общего пакета search_trees в корне репозитория
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from search_trees import AVL, BST, Treap
 
 
 """
-Класс BST реализует бинарное дерево поиска с основными операциями:
-- вставка (insert)
-- поиск (search) 
-- удаление (delete)
-- обход (in_order)
+Класс CompactAVL - AVL-дерево без объектов-узлов: ключи, потомки и высоты
+хранятся в параллельных типизированных массивах, узел - это индекс в них
+(-1 - пустой потомок). Освобождённые при удалении ячейки образуют список
+свободных (связанный через массив left) и переиспользуются при вставке.
+Ключи - целые числа (тип массива key_type, по умолчанию 'q').
 """
 
 
-class BST:
-    def __init__(self):
-        self.root = None  # Корень дерева
+class CompactAVL:
+    def __init__(self, key_type='q'):
+        self.keys = typed_array(key_type)
+        self.left = typed_array('i')
+        self.right = typed_array('i')
+        self.height = typed_array('b')
+        self.root = -1  # Индекс корня
+        self.free = -1  # Голова списка свободных ячеек
+        self.count = 0  # Количество ключей
+
+    def __len__(self):
+        return self.count
+
+    # Выделение ячейки под новый узел (из списка свободных или в конце массивов)
+    def _new_node(self, key):
+        if self.free != -1:
+            i = self.free
+            self.free = self.left[i]
+            self.keys[i] = key
+            self.left[i] = -1
+            self.right[i] = -1
+            self.height[i] = 1
+        else:
+            i = len(self.keys)
+            self.keys.append(key)
+            self.left.append(-1)
+            self.right.append(-1)
+            self.height.append(1)
+        self.count += 1
+        return i
+
+    # Возврат ячейки в список свободных
+    def _free_node(self, i):
+        self.left[i] = self.free
+        self.free = i
+        self.count -= 1
+
+    def _get_height(self, i):
+        return self.height[i] if i != -1 else 0
+
+    def _update(self, i):
+        self.height[i] = 1 + max(self._get_height(self.left[i]),
+                                 self._get_height(self.right[i]))
+
+    def _get_balance(self, i):
+        return self._get_height(self.left[i]) - self._get_height(self.right[i])
 
-    # Вставка нового ключа в дерево (итеративная реализация)
-        # Вставка нового ключа в дерево (итеративная реализация)
-    def insert(self, key):
-        if not self.root:
-            self.root = Node(key)
-            return
+    def _left_rotate(self, z):
+        y = self.right[z]
+        self.right[z] = self.left[y]
+        self.left[y] = z
+        self._update(z)
+        self._update(y)
+        return y
 
-        current = self.root
-        while True:
-            if key < current.key:  # Идем в левое поддерево
-                if not current.left:
-                    current.left = Node(key)
-                    break
-                else:
-                    current = current.left
-            else:  # Идем в правое поддерево
-                if not current.right:
-                    current.right = Node(key)
-                    break
-                else:
-                    current = current.right
-
-    # Рекурсивный поиск
-    def search(self, key):
-        return self._search_recursive(self.root, key)
+    def _right_rotate(self, z):
+        y = self.left[z]
+        self.left[z] = self.right[y]
+        self.right[y] = z
+        self._update(z)
+        self._update(y)
+        return y
+
+    # Пересчёт высоты и повороты при нарушении баланса
+    def _rebalance(self, i):
+        self._update(i)
+        balance = self._get_balance(i)
+        if balance > 1:
+            if self._get_balance(self.left[i]) < 0:
+                self.left[i] = self._left_rotate(self.left[i])
+            return self._right_rotate(i)
+        if balance < -1:
+            if self._get_balance(self.right[i]) > 0:
+                self.right[i] = self._right_rotate(self.right[i])
+            return self._left_rotate(i)
+        return i
 
-    def _search_recursive(self, node, key):
-        if node is None:
-            return False
+    def insert(self, key):
+        self.root = self._insert(self.root, key)
 
-        if key == node.key:
-            return True
-        elif key < node.key:
-            return self._search_recursive(node.left, key)
+    def _insert(self, i, key):
+        if i == -1:
+            return self._new_node(key)
+        if key < self.keys[i]:
+            self.left[i] = self._insert(self.left[i], key)
         else:
-            return self._search_recursive(node.right, key)
-
-    # Рекурсивный обход (in-order)
-    def in_order(self):
-        elements = []
-        self._in_order_recursive(self.root, elements)
-        return elements
+            self.right[i] = self._insert(self.right[i], key)
+        return self._rebalance(i)
 
-    def _in_order_recursive(self, node, elements):
-        if node:
-            self._in_order_recursive(node.left, elements)
-            elements.append(node.key)
-            self._in_order_recursive(node.right, elements)
+    def search(self, key):
+        i = self.root
+        while i != -1:
+            node_key = self.keys[i]
+            if key == node_key:
+                return True
+            i = self.left[i] if key < node_key else self.right[i]
+        return False
 
-    # Удаление ключа из дерева
     def delete(self, key):
         self.root = self._delete(self.root, key)
 
-    # Вспомогательная рекурсивная функция для удаления
-    def _delete(self, node, key):
-        if node is None:
-            return node
-
-        if key < node.key:  # Ищем в левом поддереве
-            node.left = self._delete(node.left, key)
-        elif key > node.key:  # Ищем в правом поддереве
-            node.right = self._delete(node.right, key)
-        else:  # Нашли узел для удаления
+    def _delete(self, i, key):
+        if i == -1:
+            return -1
+        if key < self.keys[i]:
+            self.left[i] = self._delete(self.left[i], key)
+        elif key > self.keys[i]:
+            self.right[i] = self._delete(self.right[i], key)
+        else:
             # Узел с одним потомком или без потомков
-            if node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
-
-            # Узел с двумя потомками - находим минимальный в правом поддереве
-            temp = self._min_value_node(node.right)
-            node.key = temp.key  # Копируем значение
-            node.right = self._delete(node.right, temp.key)  # Удаляем дубликат
-
-        return node
-
-    # Поиск узла с минимальным значением в поддереве
-    def _min_value_node(self, node):
-        current = node
-        while current.left:
-            current = current.left
-        return current
+            if self.left[i] == -1 or self.right[i] == -1:
+                child = self.left[i] if self.left[i] != -1 else self.right[i]
+                self._free_node(i)
+                return child
+
+            # Узел с двумя потомками - копируем минимальный ключ правого поддерева
+            successor = self.right[i]
+            while self.left[successor] != -1:
+                successor = self.left[successor]
+            self.keys[i] = self.keys[successor]
+            self.right[i] = self._delete(self.right[i], self.keys[i])
+        return self._rebalance(i)
+
+    # Итеративный обход (in-order)
+    def iter_in_order(self):
+        stack = []
+        i = self.root
+        while stack or i != -1:
+            while i != -1:
+                stack.append(i)
+                i = self.left[i]
+            i = stack.pop()
+            yield self.keys[i]
+            i = self.right[i]
+
+    def __iter__(self):
+        return self.iter_in_order()
 
+    def in_order(self):
+        return list(self.iter_in_order())
 
 
 """
-Класс AVL расширяет BST, добавляя балансировку для поддержания 
-оптимальной высоты дерева после операций вставки и удаления.
+Класс SortedArray - отсортированный список Python с двоичным поиском (bisect):
+поиск за O(log n), вставка и удаление за O(n) из-за сдвига элементов,
+но сдвиг выполняется одним memmove и на практике очень быстр.
 """
 
 
-class AVL(BST):
-    # Переопределяем вставку с балансировкой
-    def insert(self, key):
-        self.root = self._insert(self.root, key)
-
-    # Рекурсивная вставка с обновлением высот и балансировкой
-    def _insert(self, node, key):
-        if not node:
-            return Node(key)  # Базовый случай рекурсии
-
-        # Обычная вставка как в BST
-        if key < node.key:
-            node.left = self._insert(node.left, key)
-        else:
-            node.right = self._insert(node.right, key)
-
-        # Обновляем высоту текущего узла
-        node.height = 1 + max(self._get_height(node.left),
-                              self._get_height(node.right))
-
-        # Проверяем баланс и выполняем повороты при необходимости
-        balance = self._get_balance(node)
-
-        # Левое-левое нарушение
-        if balance > 1 and key < node.left.key:
-            return self._right_rotate(node)
-
-        # Правое-правое нарушение
-        if balance < -1 and key > node.right.key:
-            return self._left_rotate(node)
+class SortedArray:
+    def __init__(self):
+        self.keys = []
 
-        # Левое-правое нарушение
-        if balance > 1 and key > node.left.key:
-            node.left = self._left_rotate(node.left)
-            return self._right_rotate(node)
+    def __len__(self):
+        return len(self.keys)
 
-        # Правое-левое нарушение
-        if balance < -1 and key < node.right.key:
-            node.right = self._right_rotate(node.right)
-            return self._left_rotate(node)
+    def insert(self, key):
+        bisect.insort(self.keys, key)
 
-        return node
+    def search(self, key):
+        i = bisect.bisect_left(self.keys, key)
+        return i < len(self.keys) and self.keys[i] == key
 
-    # Переопределяем удаление с балансировкой
     def delete(self, key):
-        self.root = self._delete(self.root, key)
-
-    # Расширенное удаление с балансировкой
-    def _delete(self, node, key):
-        # Сначала выполняем стандартное удаление BST
-        node = super()._delete(node, key)
-
-        if node is None:
-            return node
-
-        # Обновляем высоту текущего узла
-        node.height = 1 + max(self._get_height(node.left),
-                              self._get_height(node.right))
-
-        # Проверяем баланс и выполняем повороты
-        balance = self._get_balance(node)
-
-        # Левое-левое
-        if balance > 1 and self._get_balance(node.left) >= 0:
-            return self._right_rotate(node)
-
-        # Правое-правое
-        if balance < -1 and self._get_balance(node.right) <= 0:
-            return self._left_rotate(node)
+        i = bisect.bisect_left(self.keys, key)
+        if i < len(self.keys) and self.keys[i] == key:
+            del self.keys[i]
 
-        # Левое-правое
-        if balance > 1 and self._get_balance(node.left) < 0:
-            node.left = self._left_rotate(node.left)
-            return self._right_rotate(node)
+    def __iter__(self):
+        return iter(self.keys)
 
-        # Правое-левое
-        if balance < -1 and self._get_balance(node.right) > 0:
-            node.right = self._right_rotate(node.right)
-            return self._left_rotate(node)
-
-        return node
-
-    # Левый поворот для балансировки
-    def _left_rotate(self, z):
-        if z is None or z.right is None:
-            return z
-
-        y = z.right
-        T2 = y.left
+    def in_order(self):
+        return list(self.keys)
 
-        # Выполняем поворот
-        y.left = z
-        z.right = T2
 
-        # Обновляем высоты
-        z.height = 1 + max(self._get_height(z.left),
-                           self._get_height(z.right))
-        y.height = 1 + max(self._get_height(y.left),
-                           self._get_height(y.right))
+"""
+Класс BlockList - отсортированный список блоков (sqrt-декомпозиция, как в
+SortedList): ключи хранятся в отсортированных блоках, а maxes - максимумы блоков.
+Переполненный (больше 2 * load) блок делится пополам, а блок, ставший меньше
+load // 2 после удаления, сливается с соседом, поэтому при нескольких блоках
+размер каждого от load // 2 до 2 * load. Блок находится двоичным поиском
+по maxes, внутри блока - bisect, поэтому сдвигается не больше 2 * load элементов.
+"""
 
-        return y  # Новый корень поддерева
 
-    # Правый поворот для балансировки
-    def _right_rotate(self, z):
-        if z is None or z.left is None:
-            return z
+class BlockList:
+    def __init__(self, load=1000):
+        self.load = load  # Базовый размер блока
+        self.blocks = []  # Отсортированные блоки
+        self.maxes = []  # Максимальный ключ каждого блока
+        self.count = 0
 
-        y = z.left
-        T3 = y.right
+    def __len__(self):
+        return self.count
 
-        # Выполняем поворот
-        y.right = z
-        z.left = T3
+    def insert(self, key):
+        if not self.blocks:
+            self.blocks.append([key])
+            self.maxes.append(key)
+            self.count = 1
+            return
 
-        # Обновляем высоты
-        z.height = 1 + max(self._get_height(z.left),
-                           self._get_height(z.right))
-        y.height = 1 + max(self._get_height(y.left),
-                           self._get_height(y.right))
+        i = bisect.bisect_right(self.maxes, key)
+        if i == len(self.blocks):
+            i -= 1
+        block = self.blocks[i]
+        bisect.insort(block, key)
+        self.maxes[i] = block[-1]
+        self.count += 1
+
+        # Переполненный блок делим пополам
+        if len(block) > 2 * self.load:
+            half = len(block) // 2
+            self.blocks[i:i + 1] = [block[:half], block[half:]]
+            self.maxes[i:i + 1] = [block[half - 1], block[-1]]
+
+    # Индекс блока и позиция в нём для первого ключа >= key (или None)
+    def _locate(self, key):
+        i = bisect.bisect_left(self.maxes, key)
+        if i == len(self.blocks):
+            return None
+        return i, bisect.bisect_left(self.blocks[i], key)
 
-        return y  # Новый корень поддерева
+    def search(self, key):
+        position = self._locate(key)
+        if position is None:
+            return False
+        i, j = position
+        return self.blocks[i][j] == key
 
-    # Получение высоты узла
-    def _get_height(self, node):
-        if not node:
-            return 0
-        return node.height
+    def delete(self, key):
+        position = self._locate(key)
+        if position is None:
+            return
+        i, j = position
+        block = self.blocks[i]
+        if block[j] != key:
+            return
+        del block[j]
+        self.count -= 1
+        if not block:
+            del self.blocks[i]
+            del self.maxes[i]
+            return
+        self.maxes[i] = block[-1]
+
+        # Недозаполненный блок сливаем с соседом (правым, у последнего - левым);
+        # если объединённый блок переполнен, снова делим его пополам
+        if len(block) < self.load // 2 and len(self.blocks) > 1:
+            k = i if i + 1 < len(self.blocks) else i - 1
+            merged = self.blocks[k] + self.blocks[k + 1]
+            if len(merged) > 2 * self.load:
+                half = len(merged) // 2
+                self.blocks[k:k + 2] = [merged[:half], merged[half:]]
+                self.maxes[k:k + 2] = [merged[half - 1], merged[-1]]
+            else:
+                self.blocks[k:k + 2] = [merged]
+                self.maxes[k:k + 2] = [merged[-1]]
+
+    def __iter__(self):
+        for block in self.blocks:
+            yield from block
 
-    # Расчет баланс-фактора (разница высот поддеревьев)
-    def _get_balance(self, node):
-        if not node:
-            return 0
-        return self._get_height(node.left) - self._get_height(node.right)
+    def in_order(self):
+        return list(self)
 
 
 """
@@ -277,11 +310,24 @@ def generate_sorted_array(size):
 1. Вставка всех элементов массива
 2. 1000 операций поиска случайных элементов
 3. 1000 операций удаления/вставки (чтобы размер дерева не менялся)
-Возвращает среднее время для каждой операции.
+4. При measure_memory=True - память дерева в байтах на ключ (tracemalloc,
+   на отдельном построении, чтобы не искажать замер времени вставки)
+Возвращает среднее время для каждой операции и память (или None).
 """
 
 
-def test_tree_performance(tree_class, array):
+def test_tree_performance(tree_class, array, measure_memory=False):
+    # Тест памяти
+    memory = None
+    if measure_memory:
+        tracemalloc.start()
+        tree = tree_class()
+        for key in array:
+            tree.insert(key)
+        memory = tracemalloc.get_traced_memory()[0] / len(array)
+        tracemalloc.stop()
+        del tree
+
     # Тест вставки
     insert_time = time.time()
     tree = tree_class()
@@ -304,7 +350,7 @@ def test_tree_performance(tree_class, array):
         tree.insert(key)  # Восстанавливаем размер дерева
     delete_time = (time.time() - delete_time) / 1000  # Среднее время удаления
 
-    return insert_time, search_time, delete_time
+    return insert_time, search_time, delete_time, memory
 
 
 """
@@ -323,117 +369,298 @@ def test_array_performance(array):
 
 
 """
-Основная функция тестирования:
-1. Выполняет серии тестов для разных размеров массивов
-2. Для каждого размера проводит 10 тестов со случайными данными 
-   и 10 тестов с отсортированными данными
-3. Сохраняет средние значения времени для каждой операции
-"""
-
-
-def run_test_series():
-    # Структура для хранения результатов
-    results = {
-        'bst_random': {'insert': [], 'search': [], 'delete': []},
-        'avl_random': {'insert': [], 'search': [], 'delete': []},
-        'bst_sorted': {'insert': [], 'search': [], 'delete': []},
-        'avl_sorted': {'insert': [], 'search': [], 'delete': []},
-        'array_random': {'search': []},
-        'array_sorted': {'search': []}
+Функция тестирования пакетной загрузки AVL-дерева из отсортированного массива:
+возвращает время построения дерева.
+"""
+
+
+def test_bulk_load_performance(array):
+    bulk_time = time.time()
+    AVL.from_sorted(array)
+    return time.time() - bulk_time
+
+
+"""
+Функция тестирования порядковых статистик:
+1000 запросов rank, select и count_range к AVL-дереву против тех же запросов
+через bisect к отсортированному списку. Возвращает среднее время запроса
+для дерева и для списка по каждой операции.
+"""
+
+
+def test_order_statistics_performance(array):
+    tree = AVL.from_unsorted(array)
+    sorted_list = sorted(array)
+    keys = [random.choice(array) for _ in range(1000)]
+    indices = [random.randrange(len(array)) for _ in range(1000)]
+    bounds = [sorted((random.choice(array), random.choice(array))) for _ in range(1000)]
+
+    queries = {
+        'rank': (lambda: [tree.rank(key) for key in keys],
+                 lambda: [bisect.bisect_left(sorted_list, key) for key in keys]),
+        'select': (lambda: [tree.select(i) for i in indices],
+                   lambda: [sorted_list[i] for i in indices]),
+        'count_range': (lambda: [tree.count_range(lo, hi) for lo, hi in bounds],
+                        lambda: [bisect.bisect_right(sorted_list, hi) - bisect.bisect_left(sorted_list, lo)
+                                 for lo, hi in bounds]),
     }
 
-    # 5 серий тестов для размеров 2^11 до 2^15
+    times = {}
+    for name, (tree_query, list_query) in queries.items():
+        tree_time = time.time()
+        tree_answers = tree_query()
+        tree_time = (time.time() - tree_time) / 1000
+
+        list_time = time.time()
+        list_answers = list_query()
+        list_time = (time.time() - list_time) / 1000
+
+        assert tree_answers == list_answers
+        times[name] = (tree_time, list_time)
+    return times
+
+
+"""
+Серия тестов порядковых статистик для размеров 2^11 до 2^15
+"""
+
+
+def run_order_statistics_series():
     for i in range(1, 6):
         size = 2 ** (10 + i)
+        times = test_order_statistics_performance(generate_random_array(size))
+        print(f"\nПорядковые статистики, размер массива = {size}")
+        for name, (tree_time, list_time) in times.items():
+            print(f"  {name}: AVL={tree_time:.8f}, bisect={list_time:.8f}")
+
+
+"""
+Функция тестирования операций над множествами:
+два AVL-дерева из size и other_size различных случайных ключей одного
+диапазона (примерно половина ключей меньшего дерева есть в большем). Для union, intersection и
+difference сравниваются операции на split/join, поэлементная обработка
+(insert/search/delete по ключам other) и встроенный set. Построение деревьев
+в замер не входит. Возвращает время каждого варианта по каждой операции.
+"""
+
+
+def test_set_operations_performance(size, other_size):
+    universe = range(2 * max(size, other_size))
+    keys = random.sample(universe, size)
+    other_keys = random.sample(universe, other_size)
+
+    # Поэлементные варианты: по одной операции дерева на ключ other
+    def insert_each(tree, other):
+        for key in other:
+            if not tree.search(key):
+                tree.insert(key)
+        return tree
+
+    def intersect_each(tree, other):
+        result = AVL()
+        for key in other:
+            if tree.search(key):
+                result.insert(key)
+        return result
+
+    def delete_each(tree, other):
+        for key in other:
+            tree.delete(key)
+        return tree
+
+    def join_based(operation):
+        def run(tree, other):
+            getattr(tree, operation)(other)
+            return tree
+        return run
+
+    operations = {
+        'union': (join_based('union'), insert_each, set.__ior__),
+        'intersection': (join_based('intersection'), intersect_each, set.__iand__),
+        'difference': (join_based('difference'), delete_each, set.__isub__),
+    }
+
+    times = {}
+    for name, (join_operation, each_operation, set_operation) in operations.items():
+        answers = []
+        times[name] = []
+        for operation in (join_operation, each_operation):
+            tree, other = AVL.from_unsorted(keys), AVL.from_unsorted(other_keys)
+            start_time = time.time()
+            result = operation(tree, other)
+            times[name].append(time.time() - start_time)
+            answers.append(result.in_order())
+
+        set_keys, set_other = set(keys), set(other_keys)
+        start_time = time.time()
+        set_keys = set_operation(set_keys, set_other)
+        times[name].append(time.time() - start_time)
+        answers.append(sorted(set_keys))
+
+        assert answers[0] == answers[1] == answers[2]
+    return times
+
+
+"""
+Серия тестов операций над множествами для 10^4 - 10^6 ключей:
+деревья равного размера, второе дерево в 100 раз меньше первого
+и первое (self) в 100 раз меньше второго
+"""
+
+
+def run_set_operations_series():
+    for n in (10 ** 4, 10 ** 5, 10 ** 6):
+        for size, other_size in ((n, n), (n, n // 100), (n // 100, n)):
+            times = test_set_operations_performance(size, other_size)
+            print(f"\nОперации над множествами, размеры = {size} и {other_size}")
+            for name, (join_time, each_time, set_time) in times.items():
+                print(f"  {name}: split/join={join_time:.6f}, поэлементно={each_time:.6f}, set={set_time:.6f}")
+
+
+"""
+Структуры данных, сравниваемые в run_test_series:
+ключ в результатах -> (класс, подпись на графиках, ограничения размера).
+Ограничения размера - словарь вид данных -> наибольший размер теста для
+структур, которые на этих данных строятся за O(n^2); большие размеры
+пропускаются (NaN на графике):
+- BST на отсортированных данных вырождается в список
+- SortedArray на случайных данных сдвигает при каждой вставке O(n) элементов
+  (на отсортированных вставка идёт в конец и сдвига нет)
+"""
+
+STRUCTURES = {
+    'bst': (BST, 'BST', {'sorted': 2 ** 15}),
+    'avl': (AVL, 'AVL', {}),
+    'treap': (Treap, 'Treap', {}),
+    'compact': (CompactAVL, 'CompactAVL', {}),
+    'sorted_array': (SortedArray, 'Отсорт. массив (bisect)', {'random': 2 ** 17}),
+    'blocklist': (BlockList, 'Блочный список', {}),
+}
+
+# Виды тестовых данных: ключ -> (генератор, подпись)
+DATA_KINDS = {
+    'random': (generate_random_array, 'случайные'),
+    'sorted': (generate_sorted_array, 'отсорт.'),
+}
+
+
+"""
+Функция одного независимого теста (выполняется в процессе-исполнителе):
+задание (структура, вид данных, размер, номер теста, seed) - данные
+генерируются заново из seed, поэтому все структуры одного теста получают
+одинаковый массив, а результат не зависит от того, какой процесс его выполнил.
+Структура 'array' - поиск в обычном массиве, 'avl_bulk' - пакетная загрузка AVL.
+Возвращает словарь операция -> время (и память на ключ для первого теста
+со случайными данными).
+"""
+
+
+def run_trial_job(job):
+    name, kind, size, trial, seed = job
+    random.seed(seed)
+    data = DATA_KINDS[kind][0](size)
+
+    if name == 'array':
+        return {'search': test_array_performance(data)}
+    if name == 'avl_bulk':
+        return {'insert': test_bulk_load_performance(data)}
+
+    measure_memory = kind == 'random' and trial == 0
+    insert_time, search_time, delete_time, memory = test_tree_performance(
+        STRUCTURES[name][0], data, measure_memory)
+    return {'insert': insert_time, 'search': search_time,
+            'delete': delete_time, 'memory': memory}
+
+
+"""
+Основная функция тестирования:
+1. Для каждого размера из sizes (по умолчанию 2^11 - 2^15) и каждого вида
+   данных формирует trials независимых тестов для каждой структуры из STRUCTURES,
+   поиска в обычном массиве и (для отсортированных данных) пакетной загрузки AVL;
+   размеры больше ограничения структуры из STRUCTURES пропускаются
+2. Каждому тесту назначается свой seed, полученный из seed серии, и тесты
+   выполняются параллельно в ProcessPoolExecutor (workers процессов,
+   по умолчанию - по числу ядер); самые большие размеры отправляются первыми
+3. Результаты собираются по ключу задания, поэтому средние не зависят
+   от порядка завершения процессов
+4. Сохраняет средние значения времени для каждой операции
+   и память в байтах на ключ (первый тест со случайными данными)
+"""
+
+
+def run_test_series(sizes=None, trials=10, workers=None, seed=0):
+    if sizes is None:
+        sizes = [2 ** (10 + i) for i in range(1, 6)]
+
+    # Seed каждого теста (общий для всех структур одного теста)
+    seed_generator = random.Random(seed)
+    trial_seeds = {(size, kind, trial): seed_generator.getrandbits(64)
+                   for size in sizes for kind in DATA_KINDS for trial in range(trials)}
+
+    # Задания: структуры деревьев, поиск в массиве и пакетная загрузка AVL
+    jobs = []
+    for size in sorted(sizes, reverse=True):
+        for kind in DATA_KINDS:
+            names = [name for name, (_, _, limits) in STRUCTURES.items()
+                     if size <= limits.get(kind, size)]
+            names.append('array')
+            if kind == 'sorted':
+                names.append('avl_bulk')
+            for name in names:
+                for trial in range(trials):
+                    jobs.append((name, kind, size, trial, trial_seeds[size, kind, trial]))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {job[:4]: executor.submit(run_trial_job, job) for job in jobs}
+        job_results = {key: future.result() for key, future in futures.items()}
+
+    # Структура для хранения результатов: '<структура>_<данные>' -> операция -> список средних
+    results = {f'{name}_{kind}': {'insert': [], 'search': [], 'delete': []}
+               for name in STRUCTURES for kind in DATA_KINDS}
+    for kind in DATA_KINDS:
+        results[f'array_{kind}'] = {'search': []}
+    results['avl_sorted_bulk'] = {'insert': []}
+    results['memory'] = {name: [] for name in STRUCTURES}
+    results['sizes'] = list(sizes)
+
+    # Среднее по тестам (NaN, если тест пропущен)
+    def average(name, kind, size, operation):
+        if (name, kind, size, 0) not in job_results:
+            return float('nan')
+        return mean(job_results[name, kind, size, trial][operation] for trial in range(trials))
+
+    for i, size in enumerate(sizes, start=1):
         print(f"\nСерия {i}: Размер массива = {size}")
 
-        # Списки для хранения временных результатов
-        bst_random_insert, bst_random_search, bst_random_delete = [], [], []
-        avl_random_insert, avl_random_search, avl_random_delete = [], [], []
-        array_random_search = []
-
-        bst_sorted_insert, bst_sorted_search, bst_sorted_delete = [], [], []
-        avl_sorted_insert, avl_sorted_search, avl_sorted_delete = [], [], []
-        array_sorted_search = []
-
-        # 10 тестов со случайными данными
-        print("  Тестируем случайные данные...")
-        for _ in range(10):
-            random_array = generate_random_array(size)
-
-            # Тестируем BST
-            ins, srch, dlt = test_tree_performance(BST, random_array)
-            bst_random_insert.append(ins)
-            bst_random_search.append(srch)
-            bst_random_delete.append(dlt)
-
-            # Тестируем AVL
-            ins, srch, dlt = test_tree_performance(AVL, random_array)
-            avl_random_insert.append(ins)
-            avl_random_search.append(srch)
-            avl_random_delete.append(dlt)
-
-            # Тестируем массив
-            array_random_search.append(test_array_performance(random_array))
-
-        # 10 тестов с отсортированными данными
-        print("  Тестируем отсортированные данные...")
-        for _ in range(10):
-            sorted_array = generate_sorted_array(size)
-
-            # Тестируем BST
-            ins, srch, dlt = test_tree_performance(BST, sorted_array)
-            bst_sorted_insert.append(ins)
-            bst_sorted_search.append(srch)
-            bst_sorted_delete.append(dlt)
-
-            # Тестируем AVL
-            ins, srch, dlt = test_tree_performance(AVL, sorted_array)
-            avl_sorted_insert.append(ins)
-            avl_sorted_search.append(srch)
-            avl_sorted_delete.append(dlt)
-
-            # Тестируем массив
-            array_sorted_search.append(test_array_performance(sorted_array))
-
-        # Вычисляем средние значения и сохраняем результаты
-        def avg(lst):
-            return sum(lst) / len(lst)
-
-        # Сохраняем результаты для случайных данных
-        results['bst_random']['insert'].append(avg(bst_random_insert))
-        results['bst_random']['search'].append(avg(bst_random_search))
-        results['bst_random']['delete'].append(avg(bst_random_delete))
-
-        results['avl_random']['insert'].append(avg(avl_random_insert))
-        results['avl_random']['search'].append(avg(avl_random_search))
-        results['avl_random']['delete'].append(avg(avl_random_delete))
-
-        results['array_random']['search'].append(avg(array_random_search))
-
-        # Сохраняем результаты для отсортированных данных
-        results['bst_sorted']['insert'].append(avg(bst_sorted_insert))
-        results['bst_sorted']['search'].append(avg(bst_sorted_search))
-        results['bst_sorted']['delete'].append(avg(bst_sorted_delete))
-
-        results['avl_sorted']['insert'].append(avg(avl_sorted_insert))
-        results['avl_sorted']['search'].append(avg(avl_sorted_search))
-        results['avl_sorted']['delete'].append(avg(avl_sorted_delete))
-
-        results['array_sorted']['search'].append(avg(array_sorted_search))
-
-        # Выводим результаты текущей серии
-        print(
-            f"  BST случайные: вставка={avg(bst_random_insert):.6f}, поиск={avg(bst_random_search):.6f}, удаление={avg(bst_random_delete):.6f}")
-        print(
-            f"  AVL случайные: вставка={avg(avl_random_insert):.6f}, поиск={avg(avl_random_search):.6f}, удаление={avg(avl_random_delete):.6f}")
-        print(f"  Массив случайные: поиск={avg(array_random_search):.6f}")
-
-        print(
-            f"  BST отсорт.: вставка={avg(bst_sorted_insert):.6f}, поиск={avg(bst_sorted_search):.6f}, удаление={avg(bst_sorted_delete):.6f}")
-        print(
-            f"  AVL отсорт.: вставка={avg(avl_sorted_insert):.6f}, поиск={avg(avl_sorted_search):.6f}, удаление={avg(avl_sorted_delete):.6f}")
-        print(f"  Массив отсорт.: поиск={avg(array_sorted_search):.6f}")
+        for kind, (_, kind_label) in DATA_KINDS.items():
+            print(f"  Тестируем {kind_label} данные...")
+
+            # Сохраняем средние значения и выводим результаты текущей серии
+            for name, (_, label, _) in STRUCTURES.items():
+                for operation in ('insert', 'search', 'delete'):
+                    results[f'{name}_{kind}'][operation].append(average(name, kind, size, operation))
+                insert_time, search_time, delete_time = (results[f'{name}_{kind}'][operation][-1]
+                                                         for operation in ('insert', 'search', 'delete'))
+                print(f"  {label} {kind_label}: вставка={insert_time:.6f}, "
+                      f"поиск={search_time:.6f}, удаление={delete_time:.6f}")
+
+            array_search = average('array', kind, size, 'search')
+            results[f'array_{kind}']['search'].append(array_search)
+            print(f"  Массив {kind_label}: поиск={array_search:.6f}")
+
+            if kind == 'sorted':
+                bulk_insert = average('avl_bulk', kind, size, 'insert')
+                results['avl_sorted_bulk']['insert'].append(bulk_insert)
+                print(f"  AVL пакетная загрузка: вставка={bulk_insert:.6f}")
+
+            if kind == 'random':
+                memory = {name: job_results[name, kind, size, 0]['memory']
+                          if (name, kind, size, 0) in job_results else float('nan')
+                          for name in STRUCTURES}
+                for name in STRUCTURES:
+                    results['memory'][name].append(memory[name])
+                print("  Память (байт на ключ): " +
+                      ", ".join(f"{label}={memory[name]:.1f}" for name, (_, label, _) in STRUCTURES.items()))
 
     return results
 
@@ -444,91 +671,68 @@ def run_test_series():
 1. Вставка (случайные данные)
 2. Поиск (случайные данные) с сравнением с массивом
 3. Удаление (случайные данные)
-4. Вставка (отсортированные данные)
+4. Вставка (отсортированные данные) с пакетной загрузкой AVL
 5. Поиск (отсортированные данные) с сравнением с массивом
 6. Удаление (отсортированные данные)
+и отдельный график памяти в байтах на ключ.
+На каждом графике - все структуры из STRUCTURES.
 """
 
 
 def plot_results(results):
-    x = [2 ** (10 + i) for i in range(1, 6)]  # Размеры массивов
+    x = results['sizes']  # Размеры массивов
 
     plt.figure(figsize=(18, 12))  # Создаем большое окно для графиков
 
-    # График 1: Вставка (случайные данные)
-    plt.subplot(2, 3, 1)
-    plt.plot(x, results['bst_random']['insert'], 'o-', label='BST')
-    plt.plot(x, results['avl_random']['insert'], 'o-', label='AVL')
-    plt.xlabel('Размер массива')
-    plt.ylabel('Время (сек)')
-    plt.title('Вставка (случайные данные)')
-    plt.legend()
-    plt.grid(True)
+    panels = [
+        ('random', 'insert', 'Вставка (случайные данные)'),
+        ('random', 'search', 'Поиск (случайные данные)'),
+        ('random', 'delete', 'Удаление (случайные данные)'),
+        ('sorted', 'insert', 'Вставка (отсортированные данные)'),
+        ('sorted', 'search', 'Поиск (отсортированные данные)'),
+        ('sorted', 'delete', 'Удаление (отсортированные данные)'),
+    ]
+    for index, (kind, operation, title) in enumerate(panels, start=1):
+        plt.subplot(2, 3, index)
+        for name, (_, label, _) in STRUCTURES.items():
+            plt.plot(x, results[f'{name}_{kind}'][operation], 'o-', label=label)
+        if operation == 'search':
+            plt.plot(x, results[f'array_{kind}']['search'], 'o-', label='Массив')
+        if kind == 'sorted' and operation == 'insert':
+            plt.plot(x, results['avl_sorted_bulk']['insert'], 'o-', label='AVL (пакетная загрузка)')
+        plt.xlabel('Размер массива')
+        plt.ylabel('Время (сек)')
+        plt.title(title)
+        plt.legend()
+        plt.grid(True)
 
-    # График 2: Поиск (случайные данные)
-    plt.subplot(2, 3, 2)
-    plt.plot(x, results['bst_random']['search'], 'o-', label='BST')
-    plt.plot(x, results['avl_random']['search'], 'o-', label='AVL')
-    plt.plot(x, results['array_random']['search'], 'o-', label='Массив')
-    plt.xlabel('Размер массива')
-    plt.ylabel('Время (сек)')
-    plt.title('Поиск (случайные данные)')
-    plt.legend()
-    plt.grid(True)
-
-    # График 3: Удаление (случайные данные)
-    plt.subplot(2, 3, 3)
-    plt.plot(x, results['bst_random']['delete'], 'o-', label='BST')
-    plt.plot(x, results['avl_random']['delete'], 'o-', label='AVL')
-    plt.xlabel('Размер массива')
-    plt.ylabel('Время (сек)')
-    plt.title('Удаление (случайные данные)')
-    plt.legend()
-    plt.grid(True)
-
-    # График 4: Вставка (отсортированные данные)
-    plt.subplot(2, 3, 4)
-    plt.plot(x, results['bst_sorted']['insert'], 'o-', label='BST')
-    plt.plot(x, results['avl_sorted']['insert'], 'o-', label='AVL')
-    plt.xlabel('Размер массива')
-    plt.ylabel('Время (сек)')
-    plt.title('Вставка (отсортированные данные)')
-    plt.legend()
-    plt.grid(True)
-
-    # График 5: Поиск (отсортированные данные)
-    plt.subplot(2, 3, 5)
-    plt.plot(x, results['bst_sorted']['search'], 'o-', label='BST')
-    plt.plot(x, results['avl_sorted']['search'], 'o-', label='AVL')
-    plt.plot(x, results['array_sorted']['search'], 'o-', label='Массив')
-    plt.xlabel('Размер массива')
-    plt.ylabel('Время (сек)')
-    plt.title('Поиск (отсортированные данные)')
-    plt.legend()
-    plt.grid(True)
+    plt.tight_layout()  # Автоматическая настройка отступов
+    plt.show()  # Показываем графики
 
-    # График 6: Удаление (отсортированные данные)
-    plt.subplot(2, 3, 6)
-    plt.plot(x, results['bst_sorted']['delete'], 'o-', label='BST')
-    plt.plot(x, results['avl_sorted']['delete'], 'o-', label='AVL')
+    # Память на ключ (случайные данные)
+    plt.figure(figsize=(8, 6))
+    for name, (_, label, _) in STRUCTURES.items():
+        plt.plot(x, results['memory'][name], 'o-', label=label)
     plt.xlabel('Размер массива')
-    plt.ylabel('Время (сек)')
-    plt.title('Удаление (отсортированные данные)')
+    plt.ylabel('Байт на ключ')
+    plt.title('Память (случайные данные)')
     plt.legend()
     plt.grid(True)
-
-    plt.tight_layout()  # Автоматическая настройка отступов
-    plt.show()  # Показываем графики
+    plt.show()
 
 
 """
-1. Устанавливаем увеличенный лимит рекурсии для работы с большими деревьями
-2. Запускаем тестирование
-3. Строим графики результатов
+1. Запускаем тестирование (все операции BST итеративны, поэтому
+   вырожденные деревья не требуют увеличения лимита рекурсии).
+   Тесты выполняются в дочерних процессах, поэтому запуск защищён
+   проверкой __main__ - иначе процессы-исполнители повторили бы его при импорте
+2. Строим графики результатов
 """
 
-sys.setrecursionlimit(1000000)  # Увеличиваем лимит рекурсии для больших деревьев
-print("Начало тестирования...")
-results = run_test_series()  # Запускаем тесты
-plot_results(results)  # Строим графики
-print("Тестирование завершено успешно!")
+if __name__ == "__main__":
+    print("Начало тестирования...")
+    results = run_test_series()  # Запускаем тесты
+    plot_results(results)  # Строим графики
+    run_order_statistics_series()  # Сравниваем порядковые статистики с bisect
+    run_set_operations_series()  # Сравниваем операции над множествами
+    print("Тестирование завершено успешно!")
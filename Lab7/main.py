@@ -1,322 +1,248 @@
+import os
+import sys
 import time
 import random
 import matplotlib.pyplot as plt
+from collections import Counter
 from statistics import mean
-import sys
 
+# Деревья Treap и AVL берутся из общего пакета search_trees в корне репозитория
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from search_trees import AVL, Treap, TreapNode, depth_stats
 
-class Node:
-    """Узел дерева, используется как в Treap, так и в AVL"""
-    def __init__(self, key, priority=None):
-        self.key = key  # Ключ узла
-        self.priority = priority if priority is not None else random.random()  # Приоритет для Treap
-        self.left = None  # Левый потомок
-        self.right = None  # Правый потомок
-        self.height = 1  # Высота поддерева (для AVL)
-
-
-class Treap:
-    """Реализация структуры данных Treap (декартово дерево)"""
-    def __init__(self):
-        self.root = None  # Корень дерева
-
-    def insert(self, key, priority=None):
-        """Вставка ключа в Treap"""
-        self.root = self._insert(self.root, key, priority)
-
-    def _insert(self, node, key, priority=None):
-        """Рекурсивная вставка ключа в поддерево"""
-        if not node:
-            return Node(key, priority)  # Создаем новый узел, если достигли пустого места
-
-        if key < node.key:
-            node.left = self._insert(node.left, key, priority)
-            # Поддерживаем свойство кучи: если приоритет левого потомка больше
-            if node.left.priority > node.priority:
-                node = self._rotate_right(node)  # Правое вращение
-        else:
-            node.right = self._insert(node.right, key, priority)
-            # Поддерживаем свойство кучи: если приоритет правого потомка больше
-            if node.right.priority > node.priority:
-                node = self._rotate_left(node)  # Левое вращение
-        return node
-
-    def _rotate_right(self, y):
-        """Правое вращение вокруг узла y"""
-        x = y.left
-        y.left = x.right
-        x.right = y
-        return x
-
-    def _rotate_left(self, x):
-        """Левое вращение вокруг узла x"""
-        y = x.right
-        x.right = y.left
-        y.left = x
-        return y
-
-    def search(self, key):
-        """Поиск ключа в дереве"""
-        return self._search(self.root, key)
-
-    def _search(self, node, key):
-        """Рекурсивный поиск ключа в поддереве"""
-        if not node:
-            return False
-        if key == node.key:
-            return True
-        elif key < node.key:
-            return self._search(node.left, key)
-        else:
-            return self._search(node.right, key)
-
-    def delete(self, key):
-        """Удаление ключа из дерева"""
-        self.root = self._delete(self.root, key)
 
-    def _delete(self, node, key):
-        """Рекурсивное удаление ключа из поддерева"""
-        if not node:
-            return node
+class SequenceNode(TreapNode):
+    """Узел ImplicitTreap: значение хранится в key, позиция задаётся размерами поддеревьев"""
+    __slots__ = ('size', 'reversed')
 
-        if key < node.key:
-            node.left = self._delete(node.left, key)
-        elif key > node.key:
-            node.right = self._delete(node.right, key)
-        else:
-            # Узел найден - выполняем удаление
-            if not node.left:
-                return node.right
-            if not node.right:
-                return node.left
-
-            # Выбираем вращение в зависимости от приоритетов
-            if node.left.priority > node.right.priority:
-                node = self._rotate_right(node)
-                node.right = self._delete(node.right, key)
+    def __init__(self, key, priority=None):
+        super().__init__(key, priority)
+        self.size = 1  # Размер поддерева
+        self.reversed = False  # Отложенный разворот поддерева
+
+
+class ImplicitTreap:
+    """Декартово дерево по неявному ключу (rope): последовательность значений,
+    где позиция узла определяется размерами поддеревьев, а не ключом.
+    Значение хранится в поле key узла SequenceNode. Вставка и удаление по индексу,
+    срез, конкатенация и разворот отрезка выполняются за O(log n)
+    через разрезание по количеству элементов и слияние"""
+    def __init__(self, values=()):
+        self.root = self._build(values)  # Корень дерева
+
+    def __len__(self):
+        return self._size(self.root)
+
+    @staticmethod
+    def _size(node):
+        """Размер поддерева"""
+        return node.size if node else 0
+
+    def _update(self, node):
+        """Пересчёт размера узла по потомкам"""
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+
+    @staticmethod
+    def _push(node):
+        """Проталкивание отложенного разворота в потомков"""
+        if node.reversed:
+            node.left, node.right = node.right, node.left
+            if node.left:
+                node.left.reversed = not node.left.reversed
+            if node.right:
+                node.right.reversed = not node.right.reversed
+            node.reversed = False
+
+    def _build(self, values):
+        """Построение дерева из последовательности за O(n): декартово дерево
+        строится стеком правого края, затем размеры считаются обходом
+        в обратном порядке"""
+        stack = []
+        for value in values:
+            node = SequenceNode(value)
+            last = None
+            while stack and stack[-1].priority < node.priority:
+                last = stack.pop()
+            node.left = last
+            if stack:
+                stack[-1].right = node
+            stack.append(node)
+        if not stack:
+            return None
+
+        # Порядок "корень, потомки" - пересчитываем размеры с конца
+        order = []
+        pending = [stack[0]]
+        while pending:
+            node = pending.pop()
+            order.append(node)
+            if node.left:
+                pending.append(node.left)
+            if node.right:
+                pending.append(node.right)
+        for node in reversed(order):
+            self._update(node)
+        return stack[0]
+
+    def _split(self, node, count):
+        """Итеративное разрезание поддерева на первые count элементов
+        и остальные. Размеры узлов пути пересчитываются снизу вверх"""
+        left_root = right_root = None
+        left_tail = right_tail = None  # Узлы, к которым подвешивается следующая часть
+        path = []
+        while node:
+            self._push(node)
+            path.append(node)
+            left_size = self._size(node.left)
+            if left_size < count:
+                count -= left_size + 1
+                if left_tail is None:
+                    left_root = node
+                else:
+                    left_tail.right = node
+                left_tail = node
+                node = node.right
             else:
-                node = self._rotate_left(node)
-                node.left = self._delete(node.left, key)
-        return node
-
-    def max_depth(self):
-        """Вычисление максимальной глубины дерева"""
-        return self._max_depth(self.root)
-
-    def _max_depth(self, node):
-        """Рекурсивное вычисление максимальной глубины поддерева"""
-        if not node:
-            return 0
-        return 1 + max(self._max_depth(node.left), self._max_depth(node.right))
-
-    def get_all_depths(self):
-        """Получение глубин всех листьев дерева"""
-        depths = []
-        self._get_all_depths(self.root, 1, depths)
-        return depths
-
-    def _get_all_depths(self, node, current_depth, depths):
-        """Рекурсивный сбор глубин листьев"""
-        if not node:
-            return
-        if not node.left and not node.right:  # Если это лист
-            depths.append(current_depth)
-        self._get_all_depths(node.left, current_depth + 1, depths)
-        self._get_all_depths(node.right, current_depth + 1, depths)
-
-
-class AVL:
-    """Реализация структуры данных AVL-дерево"""
-    def __init__(self):
-        self.root = None  # Корень дерева
-
-    def insert(self, key):
-        """Вставка ключа в AVL-дерево"""
-        self.root = self._insert(self.root, key)
-
-    def _insert(self, node, key):
-        """Рекурсивная вставка ключа в поддерево"""
-        if not node:
-            return Node(key)
-
-        if key < node.key:
-            node.left = self._insert(node.left, key)
-        else:
-            node.right = self._insert(node.right, key)
-
-        # Обновляем высоту текущего узла
-        node.height = 1 + max(self._get_height(node.left),
-                             self._get_height(node.right))
-
-        # Проверяем баланс и выполняем балансировку
-        balance = self._get_balance(node)
-
-        # Левое поддерево перевешивает (LL-случай)
-        if balance > 1 and key < node.left.key:
-            return self._right_rotate(node)
-
-        # Правое поддерево перевешивает (RR-случай)
-        if balance < -1 and key > node.right.key:
-            return self._left_rotate(node)
-
-        # Левое-правое поддерево (LR-случай)
-        if balance > 1 and key > node.left.key:
-            node.left = self._left_rotate(node.left)
-            return self._right_rotate(node)
-
-        # Правое-левое поддерево (RL-случай)
-        if balance < -1 and key < node.right.key:
-            node.right = self._right_rotate(node.right)
-            return self._left_rotate(node)
-
-        return node
-
-    def delete(self, key):
-        """Удаление ключа из AVL-дерева"""
-        self.root = self._delete(self.root, key)
-
-    def _delete(self, node, key):
-        """Рекурсивное удаление ключа из поддерева"""
-        if not node:
-            return node
-
-        if key < node.key:
-            node.left = self._delete(node.left, key)
-        elif key > node.key:
-            node.right = self._delete(node.right, key)
-        else:
-            # Узел найден - выполняем удаление
-            if node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
-
-            # Находим минимальный узел в правом поддереве
-            temp = self._min_value_node(node.right)
-            node.key = temp.key
-            node.right = self._delete(node.right, temp.key)
-
-        if node is None:
-            return node
-
-        # Обновляем высоту текущего узла
-        node.height = 1 + max(self._get_height(node.left),
-                             self._get_height(node.right))
-
-        # Проверяем баланс и выполняем балансировку
-        balance = self._get_balance(node)
-
-        # Балансировка после удаления
-        if balance > 1 and self._get_balance(node.left) >= 0:
-            return self._right_rotate(node)
-
-        if balance < -1 and self._get_balance(node.right) <= 0:
-            return self._left_rotate(node)
-
-        if balance > 1 and self._get_balance(node.left) < 0:
-            node.left = self._left_rotate(node.left)
-            return self._right_rotate(node)
-
-        if balance < -1 and self._get_balance(node.right) > 0:
-            node.right = self._right_rotate(node.right)
-            return self._left_rotate(node)
-
-        return node
-
-    def _left_rotate(self, z):
-        """Левое вращение вокруг узла z"""
-        if z is None or z.right is None:
-            return z
-
-        y = z.right
-        T2 = y.left
-
-        y.left = z
-        z.right = T2
-
-        z.height = 1 + max(self._get_height(z.left),
-                          self._get_height(z.right))
-        y.height = 1 + max(self._get_height(y.left),
-                          self._get_height(y.right))
-
-        return y
-
-    def _right_rotate(self, z):
-        """Правое вращение вокруг узла z"""
-        if z is None or z.left is None:
-            return z
-
-        y = z.left
-        T3 = y.right
-
-        y.right = z
-        z.left = T3
-
-        z.height = 1 + max(self._get_height(z.left),
-                          self._get_height(z.right))
-        y.height = 1 + max(self._get_height(y.left),
-                          self._get_height(y.right))
-
-        return y
-
-    def _get_height(self, node):
-        """Получение высоты поддерева"""
-        if not node:
-            return 0
-        return node.height
-
-    def _get_balance(self, node):
-        """Вычисление баланса узла (разница высот поддеревьев)"""
-        if not node:
-            return 0
-        return self._get_height(node.left) - self._get_height(node.right)
-
-    def _min_value_node(self, node):
-        """Поиск узла с минимальным ключом в поддереве"""
-        current = node
-        while current.left:
-            current = current.left
-        return current
-
-    def search(self, key):
-        """Поиск ключа в дереве"""
-        return self._search(self.root, key)
-
-    def _search(self, node, key):
-        """Рекурсивный поиск ключа в поддереве"""
-        if not node:
-            return False
-        if key == node.key:
-            return True
-        elif key < node.key:
-            return self._search(node.left, key)
+                if right_tail is None:
+                    right_root = node
+                else:
+                    right_tail.left = node
+                right_tail = node
+                node = node.left
+        if left_tail:
+            left_tail.right = None
+        if right_tail:
+            right_tail.left = None
+        for node in reversed(path):
+            self._update(node)
+        return left_root, right_root
+
+    def _merge(self, left, right):
+        """Итеративное слияние: все элементы left идут перед элементами right"""
+        root = parent = None
+        parent_right = False  # К какой стороне parent подвешивается следующий узел
+        path = []
+        while left and right:
+            if left.priority > right.priority:
+                self._push(left)
+                node, left, next_right = left, left.right, True
+            else:
+                self._push(right)
+                node, right, next_right = right, right.left, False
+            if parent is None:
+                root = node
+            elif parent_right:
+                parent.right = node
+            else:
+                parent.left = node
+            path.append(node)
+            parent, parent_right = node, next_right
+        rest = left or right
+        if parent is None:
+            return rest
+        if parent_right:
+            parent.right = rest
         else:
-            return self._search(node.right, key)
-
-    def max_depth(self):
-        """Вычисление максимальной глубины дерева"""
-        return self._max_depth(self.root)
-
-    def _max_depth(self, node):
-        """Рекурсивное вычисление максимальной глубины поддерева"""
-        if not node:
-            return 0
-        return 1 + max(self._max_depth(node.left), self._max_depth(node.right))
-
-    def get_all_depths(self):
-        """Получение глубин всех листьев дерева"""
-        depths = []
-        self._get_all_depths(self.root, 1, depths)
-        return depths
-
-    def _get_all_depths(self, node, current_depth, depths):
-        """Рекурсивный сбор глубин листьев"""
-        if not node:
+            parent.left = rest
+        for node in reversed(path):
+            self._update(node)
+        return root
+
+    def _check_index(self, index, upper):
+        """Приведение отрицательного индекса и проверка 0 <= index < upper"""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < upper:
+            raise IndexError("индекс вне последовательности")
+        return index
+
+    def insert(self, index, value):
+        """Вставка значения перед позицией index (index == len - в конец)"""
+        index = self._check_index(index, len(self) + 1)
+        left, right = self._split(self.root, index)
+        self.root = self._merge(self._merge(left, SequenceNode(value)), right)
+
+    def append(self, value):
+        """Добавление значения в конец"""
+        self.root = self._merge(self.root, SequenceNode(value))
+
+    def delete(self, index):
+        """Удаление элемента по индексу, возвращает его значение"""
+        index = self._check_index(index, len(self))
+        left, right = self._split(self.root, index)
+        middle, right = self._split(right, 1)
+        self.root = self._merge(left, right)
+        return middle.key
+
+    def __getitem__(self, index):
+        """Значение по индексу (спуск по размерам поддеревьев)"""
+        index = self._check_index(index, len(self))
+        node = self.root
+        while True:
+            self._push(node)
+            left_size = self._size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node.key
+            else:
+                index -= left_size + 1
+                node = node.right
+
+    def slice(self, start, stop):
+        """Значения элементов с индексами start <= i < stop: O(log n + длина среза)"""
+        start, stop, _ = slice(start, stop).indices(len(self))
+        left, right = self._split(self.root, start)
+        middle, right = self._split(right, max(stop - start, 0))
+        values = list(self._iter_nodes(middle))
+        self.root = self._merge(self._merge(left, middle), right)
+        return values
+
+    def concat(self, other):
+        """Присоединение последовательности other в конец; other становится пустой"""
+        self.root = self._merge(self.root, other.root)
+        other.root = None
+
+    def split(self, index):
+        """Разрезание на первые index элементов и остальные.
+        Узлы переходят в результат, сама последовательность становится пустой"""
+        left, right = ImplicitTreap(), ImplicitTreap()
+        left.root, right.root = self._split(self.root, index)
+        self.root = None
+        return left, right
+
+    def reverse(self, start, stop):
+        """Разворот элементов с индексами start <= i < stop (отложенная пометка)"""
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if stop - start < 2:
             return
-        if not node.left and not node.right:  # Если это лист
-            depths.append(current_depth)
-        self._get_all_depths(node.left, current_depth + 1, depths)
-        self._get_all_depths(node.right, current_depth + 1, depths)
+        left, right = self._split(self.root, start)
+        middle, right = self._split(right, stop - start)
+        middle.reversed = not middle.reversed
+        self.root = self._merge(self._merge(left, middle), right)
+
+    def _iter_nodes(self, node):
+        """Итеративный симметричный обход поддерева с проталкиванием разворотов"""
+        stack = []
+        while stack or node:
+            while node:
+                self._push(node)
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    def __iter__(self):
+        return self._iter_nodes(self.root)
+
+    def to_list(self):
+        """Все значения последовательности в порядке индексов"""
+        return list(self)
+
+    def depth_stats(self):
+        """Статистика глубин дерева (разворот не меняет глубины узлов)"""
+        return depth_stats(self.root)
 
 
 def generate_random_array(size):
@@ -324,195 +250,164 @@ def generate_random_array(size):
     return [random.randint(0, 10 * size) for _ in range(size)]
 
 
+# Сравниваемые деревья: название -> класс с протоколом search_trees
+# (insert/search/delete/depth_stats)
+TREES = {
+    'Treap': Treap,
+    'AVL': AVL,
+}
+
+# Усредняемые показатели каждого дерева
+METRICS = ('insert_time', 'delete_time', 'search_time', 'max_height', 'avg_depth')
+
+
 def run_comparison_tests():
-    """Запуск тестов для сравнения Treap и AVL деревьев"""
+    """Запуск тестов для сравнения деревьев из TREES"""
     sizes = [2 ** i for i in range(10, 16)]  # Размеры массивов от 2^10 до 2^15
     num_repeats = 50  # Количество повторений для каждого размера
 
-    # Словарь для хранения результатов
-    results = {
-        'Treap': {
-            'insert_time': [],
-            'delete_time': [],
-            'search_time': [],
-            'max_height': [],
-            'avg_depth': [],  # Добавляем среднюю глубину веток
-            'all_depths': []
-        },
-        'AVL': {
-            'insert_time': [],
-            'delete_time': [],
-            'search_time': [],
-            'max_height': [],
-            'avg_depth': [],  # Добавляем среднюю глубину веток
-            'all_depths': []
-        }
-    }
+    # Словарь для хранения результатов: дерево -> показатель -> среднее для каждого размера.
+    # Распределение глубин листьев хранится гистограммой (Counter глубина -> количество
+    # листьев по всем повторам), а не списком глубин каждого листа
+    results = {name: {**{metric: [] for metric in METRICS}, 'depth_histogram': []} for name in TREES}
 
     for n in sizes:
         print(f"\nТестирование размера: {n}")
-        treap_insert_times = []
-        treap_delete_times = []
-        treap_search_times = []
-        treap_max_heights = []
-        treap_avg_depths = []  # Средние глубины для каждого теста Treap
-        treap_all_depths = []
-
-        avl_insert_times = []
-        avl_delete_times = []
-        avl_search_times = []
-        avl_max_heights = []
-        avl_avg_depths = []  # Средние глубины для каждого теста AVL
-        avl_all_depths = []
+        measurements = {name: {metric: [] for metric in METRICS} for name in TREES}
+        depth_histograms = {name: Counter() for name in TREES}
 
         for repeat in range(num_repeats):
             print(f"  Повтор {repeat + 1}/{num_repeats}", end="\r")
             data = generate_random_array(n)
+            search_data = random.choices(data, k=100)
+            delete_data = random.choices(data, k=100)
 
-            # Тестирование Treap
-            start = time.time()
-            treap = Treap()
-            for key in data:
-                treap.insert(key)
-            treap_insert_times.append(time.time() - start)
+            for name, tree_class in TREES.items():
+                current = measurements[name]
 
-            max_h = treap.max_depth()
-            treap_max_heights.append(max_h)
+                start = time.time()
+                tree = tree_class()
+                for key in data:
+                    tree.insert(key)
+                current['insert_time'].append(time.time() - start)
 
-            depths = treap.get_all_depths()
-            treap_all_depths.extend(depths)
-            avg_depth = mean(depths) if depths else 0
-            treap_avg_depths.append(avg_depth)
+                # Максимальная и средняя глубина листьев за один обход
+                stats = tree.depth_stats()
+                current['max_height'].append(stats.max_depth)
+                current['avg_depth'].append(stats.mean_leaf_depth)
+                depth_histograms[name].update(stats.histogram)
 
-            search_data = random.choices(data, k=100)
-            start = time.time()
-            for key in search_data:
-                treap.search(key)
-            treap_search_times.append((time.time() - start) / 100)
+                start = time.time()
+                for key in search_data:
+                    tree.search(key)
+                current['search_time'].append((time.time() - start) / 100)
 
-            delete_data = random.choices(data, k=100)
-            start = time.time()
-            for key in delete_data:
-                treap.delete(key)
-            treap_delete_times.append((time.time() - start) / 100)
-
-            # Тестирование AVL
-            start = time.time()
-            avl = AVL()
-            for key in data:
-                avl.insert(key)
-            avl_insert_times.append(time.time() - start)
-
-            max_h = avl.max_depth()
-            avl_max_heights.append(max_h)
-
-            depths = avl.get_all_depths()
-            avl_all_depths.extend(depths)
-            avg_depth = mean(depths) if depths else 0
-            avl_avg_depths.append(avg_depth)
-
-            start = time.time()
-            for key in search_data:
-                avl.search(key)
-            avl_search_times.append((time.time() - start) / 100)
-
-            start = time.time()
-            for key in delete_data:
-                avl.delete(key)
-            avl_delete_times.append((time.time() - start) / 100)
+                start = time.time()
+                for key in delete_data:
+                    tree.delete(key)
+                current['delete_time'].append((time.time() - start) / 100)
 
         # Сохранение средних результатов
-        results['Treap']['insert_time'].append(mean(treap_insert_times))
-        results['Treap']['delete_time'].append(mean(treap_delete_times))
-        results['Treap']['search_time'].append(mean(treap_search_times))
-        results['Treap']['max_height'].append(mean(treap_max_heights))
-        results['Treap']['avg_depth'].append(mean(treap_avg_depths))
-        results['Treap']['all_depths'].append(treap_all_depths)
-
-        results['AVL']['insert_time'].append(mean(avl_insert_times))
-        results['AVL']['delete_time'].append(mean(avl_delete_times))
-        results['AVL']['search_time'].append(mean(avl_search_times))
-        results['AVL']['max_height'].append(mean(avl_max_heights))
-        results['AVL']['avg_depth'].append(mean(avl_avg_depths))
-        results['AVL']['all_depths'].append(avl_all_depths)
+        for name in TREES:
+            for metric in METRICS:
+                results[name][metric].append(mean(measurements[name][metric]))
+            results[name]['depth_histogram'].append(depth_histograms[name])
 
         # Вывод статистики для текущего размера
         print("\nРезультаты для размера", n)
-        print("Treap:")
-        print(f"  Средняя максимальная глубина: {mean(treap_max_heights):.2f}")
-        print(f"  Среднее время вставки: {mean(treap_insert_times):.6f} сек")
-        print(f"  Среднее время удаления: {mean(treap_delete_times):.6f} сек")
-        print(f"  Среднее время поиска: {mean(treap_search_times):.6f} сек")
-        print(f"  Средняя глубина веток: {mean(treap_avg_depths):.2f}")
-
-        print("\nAVL:")
-        print(f"  Средняя максимальная глубина: {mean(avl_max_heights):.2f}")
-        print(f"  Среднее время вставки: {mean(avl_insert_times):.6f} сек")
-        print(f"  Среднее время удаления: {mean(avl_delete_times):.6f} сек")
-        print(f"  Среднее время поиска: {mean(avl_search_times):.6f} сек")
-        print(f"  Средняя глубина веток: {mean(avl_avg_depths):.2f}")
+        for name in TREES:
+            current = measurements[name]
+            print(f"{name}:")
+            print(f"  Средняя максимальная глубина: {mean(current['max_height']):.2f}")
+            print(f"  Среднее время вставки: {mean(current['insert_time']):.6f} сек")
+            print(f"  Среднее время удаления: {mean(current['delete_time']):.6f} сек")
+            print(f"  Среднее время поиска: {mean(current['search_time']):.6f} сек")
+            print(f"  Средняя глубина веток: {mean(current['avg_depth']):.2f}")
         print("----------------------------------------")
 
     return sizes, results
 
 
-def plot_results(sizes, results):
-    """Построение графиков с результатами сравнения"""
-    # 1. График времени вставки
-    plt.figure(figsize=(12, 6))
-    plt.plot(sizes, results['Treap']['insert_time'], 'o-', label='Treap')
-    plt.plot(sizes, results['AVL']['insert_time'], 'o-', label='AVL')
-    plt.xscale('log', base=2)
-    plt.yscale('log')
-    plt.xlabel('Количество элементов')
-    plt.ylabel('Время (секунды)')
-    plt.title('Сравнение времени вставки')
-    plt.legend()
-    plt.grid(True)
-    plt.show()
+def run_sequence_tests():
+    """Сравнение ImplicitTreap со списком Python на вставке и удалении
+    по случайному индексу и развороте случайного отрезка: у списка каждая
+    операция сдвигает O(n) элементов, у дерева - O(log n) шагов"""
+    num_operations = 1000  # Количество операций каждого вида
+    for n in [10 ** 5, 3 * 10 ** 5, 10 ** 6]:
+        values = list(range(n))
+        sequence = values[:]
+        rope = ImplicitTreap(values)
 
-    # 2. График времени удаления
-    plt.figure(figsize=(12, 6))
-    plt.plot(sizes, results['Treap']['delete_time'], 'o-', label='Treap')
-    plt.plot(sizes, results['AVL']['delete_time'], 'o-', label='AVL')
-    plt.xscale('log', base=2)
-    plt.yscale('log')
-    plt.xlabel('Количество элементов')
-    plt.ylabel('Время (секунды)')
-    plt.title('Сравнение времени удаления')
-    plt.legend()
-    plt.grid(True)
-    plt.show()
+        positions = [random.randint(0, n) for _ in range(num_operations)]
+        ranges = [sorted(random.sample(range(n + 1), 2)) for _ in range(num_operations)]
 
-    # 3. График времени поиска
-    plt.figure(figsize=(12, 6))
-    plt.plot(sizes, results['Treap']['search_time'], 'o-', label='Treap')
-    plt.plot(sizes, results['AVL']['search_time'], 'o-', label='AVL')
-    plt.xscale('log', base=2)
-    plt.yscale('log')
-    plt.xlabel('Количество элементов')
-    plt.ylabel('Время (секунды)')
-    plt.title('Сравнение времени поиска')
-    plt.legend()
-    plt.grid(True)
-    plt.show()
+        start = time.time()
+        for i in positions:
+            sequence.insert(i, -1)
+        list_insert = (time.time() - start) / num_operations
 
-    # 4. График максимальной высоты
-    plt.figure(figsize=(12, 6))
-    plt.plot(sizes, results['Treap']['max_height'], 'o-', label='Treap')
-    plt.plot(sizes, results['AVL']['max_height'], 'o-', label='AVL')
-    plt.xscale('log', base=2)
-    plt.xlabel('Количество элементов')
-    plt.ylabel('Максимальная высота')
-    plt.title('Сравнение высоты деревьев')
-    plt.legend()
-    plt.grid(True)
-    plt.show()
+        start = time.time()
+        for i in positions:
+            rope.insert(i, -1)
+        rope_insert = (time.time() - start) / num_operations
+
+        start = time.time()
+        for i in positions:
+            del sequence[i]
+        list_delete = (time.time() - start) / num_operations
+
+        start = time.time()
+        for i in positions:
+            rope.delete(i)
+        rope_delete = (time.time() - start) / num_operations
+
+        start = time.time()
+        for lo, hi in ranges:
+            sequence[lo:hi] = sequence[lo:hi][::-1]
+        list_reverse = (time.time() - start) / num_operations
+
+        start = time.time()
+        for lo, hi in ranges:
+            rope.reverse(lo, hi)
+        rope_reverse = (time.time() - start) / num_operations
+
+        assert rope.to_list() == sequence
+
+        print(f"\nПоследовательность из {n} элементов (среднее на операцию):")
+        print(f"  Вставка по индексу: list={list_insert:.8f} сек, ImplicitTreap={rope_insert:.8f} сек")
+        print(f"  Удаление по индексу: list={list_delete:.8f} сек, ImplicitTreap={rope_delete:.8f} сек")
+        print(f"  Разворот отрезка: list={list_reverse:.8f} сек, ImplicitTreap={rope_reverse:.8f} сек")
+
+
+def plot_results(sizes, results):
+    """Построение графиков с результатами сравнения"""
+    # 1-4. Графики времени операций и максимальной высоты
+    line_plots = [
+        ('insert_time', 'Время (секунды)', 'Сравнение времени вставки', True),
+        ('delete_time', 'Время (секунды)', 'Сравнение времени удаления', True),
+        ('search_time', 'Время (секунды)', 'Сравнение времени поиска', True),
+        ('max_height', 'Максимальная высота', 'Сравнение высоты деревьев', False),
+    ]
+    for metric, ylabel, title, log_y in line_plots:
+        plt.figure(figsize=(12, 6))
+        for name in TREES:
+            plt.plot(sizes, results[name][metric], 'o-', label=name)
+        plt.xscale('log', base=2)
+        if log_y:
+            plt.yscale('log')
+        plt.xlabel('Количество элементов')
+        plt.ylabel(ylabel)
+        plt.title(title)
+        plt.legend()
+        plt.grid(True)
+        plt.show()
 
     # 5. Гистограмма распределения высот (N=2^15)
     plt.figure(figsize=(12, 6))
-    plt.hist(results['Treap']['all_depths'][-1], bins=50, alpha=0.5, label='Treap')
-    plt.hist(results['AVL']['all_depths'][-1], bins=50, alpha=0.5, label='AVL')
+    for name in TREES:
+        histogram = results[name]['depth_histogram'][-1]
+        depths = sorted(histogram)
+        plt.bar(depths, [histogram[depth] for depth in depths], width=1.0, alpha=0.5, label=name)
     plt.xlabel('Глубина')
     plt.ylabel('Частота')
     plt.title(f'Распределение глубин (N={sizes[-1]})')
@@ -522,8 +417,8 @@ def plot_results(sizes, results):
 
     # 6. Гистограмма средних максимальных высот
     plt.figure(figsize=(12, 6))
-    plt.hist(results['Treap']['max_height'], bins=20, alpha=0.5, label='Treap')
-    plt.hist(results['AVL']['max_height'], bins=20, alpha=0.5, label='AVL')
+    for name in TREES:
+        plt.hist(results[name]['max_height'], bins=20, alpha=0.5, label=name)
     plt.xlabel('Максимальная высота')
     plt.ylabel('Частота')
     plt.title('Распределение максимальных высот')
@@ -533,9 +428,10 @@ def plot_results(sizes, results):
 
 
 if __name__ == "__main__":
-    sys.setrecursionlimit(1000000)  # Увеличиваем лимит рекурсии для больших деревьев
     print("Начало тестирования...")
     sizes, results = run_comparison_tests()
     print("\nТестирование завершено. Построение графиков...")
     plot_results(sizes, results)
+    print("\nСравнение ImplicitTreap со списком...")
+    run_sequence_tests()
     print("Готово!")
\ No newline at end of file
@@ -0,0 +1,25 @@
+"""
+Пакет search_trees - деревья поиска, общие для лабораторных 6 и 7:
+BST, AVL и Treap с общим протоколом insert/search/delete/iter/depth_stats
+(см. base.py). Новый тип дерева наследуется от SearchTree и добавляется
+в таблицу сравниваемых структур (STRUCTURES в Lab6, TREES в Lab7).
+"""
+
+from .base import DepthStats, SearchTree, depth_stats
+from .nodes import AVLNode, Node, SizedNode, TreapNode
+from .bst import BST
+from .avl import AVL
+from .treap import Treap
+
+__all__ = [
+    'AVL',
+    'AVLNode',
+    'BST',
+    'DepthStats',
+    'Node',
+    'SearchTree',
+    'SizedNode',
+    'Treap',
+    'TreapNode',
+    'depth_stats',
+]
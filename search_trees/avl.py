@@ -0,0 +1,266 @@
+"""
+Класс AVL расширяет BST, добавляя балансировку для поддержания
+оптимальной высоты дерева после операций вставки и удаления,
+пакетную загрузку и операции над множествами на split/join.
+"""
+
+from .bst import BST
+from .nodes import AVLNode
+
+
+class AVL(BST):
+    # Пакетная загрузка из отсортированной последовательности за O(n):
+    # корнем каждого поддерева становится средний элемент, поэтому дерево
+    # идеально сбалансировано и повороты не нужны
+    @classmethod
+    def from_sorted(cls, iterable):
+        keys = list(iterable)
+        for i in range(1, len(keys)):
+            if keys[i] < keys[i - 1]:
+                raise ValueError("from_sorted ожидает отсортированную последовательность")
+        tree = cls()
+        tree.root = tree._build_balanced(keys, 0, len(keys))
+        return tree
+
+    # Пакетная загрузка из произвольной последовательности: сортировка + from_sorted
+    @classmethod
+    def from_unsorted(cls, iterable):
+        return cls.from_sorted(sorted(iterable))
+
+    # Построение сбалансированного поддерева из keys[lo:hi] с вычислением высот и размеров
+    # (глубина рекурсии O(log n))
+    def _build_balanced(self, keys, lo, hi):
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = AVLNode(keys[mid])
+        node.left = self._build_balanced(keys, lo, mid)
+        node.right = self._build_balanced(keys, mid + 1, hi)
+        self._update(node)
+        return node
+
+    # Переопределяем вставку с балансировкой
+    def insert(self, key):
+        self.root = self._insert(self.root, key)
+
+    # Рекурсивная вставка с обновлением высот и балансировкой
+    def _insert(self, node, key):
+        if not node:
+            return AVLNode(key)  # Базовый случай рекурсии
+
+        # Обычная вставка как в BST
+        if key < node.key:
+            node.left = self._insert(node.left, key)
+        else:
+            node.right = self._insert(node.right, key)
+
+        # Обновляем высоту и размер, при необходимости выполняем повороты
+        return self._rebalance(node)
+
+    # Переопределяем удаление с балансировкой
+    def delete(self, key):
+        self.root = self._delete(self.root, key)
+
+    # Рекурсивное удаление с балансировкой (глубина рекурсии O(log n),
+    # так как AVL-дерево сбалансировано)
+    def _delete(self, node, key):
+        if node is None:
+            return node
+
+        if key < node.key:  # Ищем в левом поддереве
+            node.left = self._delete(node.left, key)
+        elif key > node.key:  # Ищем в правом поддереве
+            node.right = self._delete(node.right, key)
+        else:  # Нашли узел для удаления
+            # Узел с одним потомком или без потомков
+            if node.left is None:
+                return node.right
+            elif node.right is None:
+                return node.left
+
+            # Узел с двумя потомками - находим минимальный в правом поддереве
+            temp = self._min_value_node(node.right)
+            node.key = temp.key  # Копируем значение
+            node.right = self._delete(node.right, temp.key)  # Удаляем дубликат
+
+        # Обновляем высоту и размер, при необходимости выполняем повороты
+        return self._rebalance(node)
+
+    # Пересчёт высоты и размера узла и повороты при нарушении баланса
+    def _rebalance(self, node):
+        self._update(node)
+        balance = self._get_balance(node)
+
+        # Случаи определяются по балансу потомка, а не сравнением ключей,
+        # иначе при вставке повторяющегося ключа дерево остаётся несбалансированным
+
+        # Левое-левое и левое-правое нарушения
+        if balance > 1:
+            if self._get_balance(node.left) < 0:
+                node.left = self._left_rotate(node.left)
+            return self._right_rotate(node)
+
+        # Правое-правое и правое-левое нарушения
+        if balance < -1:
+            if self._get_balance(node.right) > 0:
+                node.right = self._right_rotate(node.right)
+            return self._left_rotate(node)
+
+        return node
+
+    # Операции над множествами за O(m log(n/m + 1)) для деревьев размеров m <= n
+    # (в любом порядке операндов). Ключи деревьев рассматриваются как множества.
+    # Результат записывается в self; узлы self переиспользуются в результате
+
+    # Объединение множеств: self становится self ∪ other. Узлы other переходят
+    # в результат, поэтому other поглощается и становится пустым (копирование
+    # other стоило бы O(|other|), а общие с other узлы испортил бы следующий поворот)
+    def union(self, other):
+        if other is self:
+            return
+        self.root = self._union(self.root, other.root)
+        other.root = None
+
+    # Пересечение множеств: self становится self ∩ other (other только читается)
+    def intersection(self, other):
+        if other is self:
+            return
+        self.root = self._intersection(self.root, other.root)
+
+    # Разность множеств: self становится self \ other (other только читается)
+    def difference(self, other):
+        if other is self:
+            self.root = None
+            return
+        self.root = self._difference(self.root, other.root)
+
+    # Соединение left + mid + right, где все ключи left <= mid.key <= все ключи right.
+    # Спускаемся по краю более высокого дерева до поддерева сравнимой высоты
+    # и балансируем на обратном пути: O(|высота left - высота right| + 1)
+    def _join(self, left, mid, right):
+        left_height = self._get_height(left)
+        right_height = self._get_height(right)
+        if left_height > right_height + 1:
+            left.right = self._join(left.right, mid, right)
+            return self._rebalance(left)
+        if right_height > left_height + 1:
+            right.left = self._join(left, mid, right.left)
+            return self._rebalance(right)
+        mid.left, mid.right = left, right
+        self._update(mid)
+        return mid
+
+    # Соединение двух деревьев без среднего узла: средним становится
+    # максимальный узел left
+    def _join2(self, left, right):
+        if left is None:
+            return right
+        left, last = self._split_last(left)
+        return self._join(left, last, right)
+
+    # Отделение максимального узла: (дерево без него, узел)
+    def _split_last(self, node):
+        if node.right is None:
+            return node.left, node
+        rest, last = self._split_last(node.right)
+        return self._join(node.left, node, rest), last
+
+    # Разрезание дерева по ключу: (ключи < key, узел с key или None, ключи > key)
+    # за O(log n) - вдоль пути поиска поддеревья заново соединяются через _join
+    def _split(self, node, key):
+        if node is None:
+            return None, None, None
+        if key < node.key:
+            left, found, right = self._split(node.left, key)
+            return left, found, self._join(right, node, node.right)
+        if key > node.key:
+            left, found, right = self._split(node.right, key)
+            return self._join(node.left, node, left), found, right
+        return node.left, node, node.right
+
+    # Объединение: корень t1 разрезает t2, половины объединяются рекурсивно
+    def _union(self, t1, t2):
+        if t1 is None:
+            return t2
+        if t2 is None:
+            return t1
+        left, _, right = self._split(t2, t1.key)
+        left = self._union(t1.left, left)
+        right = self._union(t1.right, right)
+        return self._join(left, t1, right)
+
+    # Пересечение: корень t2 разрезает t1; найденный в t1 узел с тем же ключом
+    # остаётся в результате. t2 не изменяется - из него читаются только ключи
+    def _intersection(self, t1, t2):
+        if t1 is None or t2 is None:
+            return None
+        left, found, right = self._split(t1, t2.key)
+        left = self._intersection(left, t2.left)
+        right = self._intersection(right, t2.right)
+        if found is not None:
+            return self._join(left, found, right)
+        return self._join2(left, right)
+
+    # Разность: корень t2 разрезает t1 и выбрасывается из результата
+    # (t2 не изменяется)
+    def _difference(self, t1, t2):
+        if t1 is None or t2 is None:
+            return t1
+        left, _, right = self._split(t1, t2.key)
+        left = self._difference(left, t2.left)
+        right = self._difference(right, t2.right)
+        return self._join2(left, right)
+
+    # Левый поворот для балансировки
+    def _left_rotate(self, z):
+        if z is None or z.right is None:
+            return z
+
+        y = z.right
+        T2 = y.left
+
+        # Выполняем поворот
+        y.left = z
+        z.right = T2
+
+        # Обновляем высоты и размеры (сначала нижний узел z)
+        self._update(z)
+        self._update(y)
+
+        return y  # Новый корень поддерева
+
+    # Правый поворот для балансировки
+    def _right_rotate(self, z):
+        if z is None or z.left is None:
+            return z
+
+        y = z.left
+        T3 = y.right
+
+        # Выполняем поворот
+        y.right = z
+        z.left = T3
+
+        # Обновляем высоты и размеры (сначала нижний узел z)
+        self._update(z)
+        self._update(y)
+
+        return y  # Новый корень поддерева
+
+    # Получение высоты узла
+    def _get_height(self, node):
+        if not node:
+            return 0
+        return node.height
+
+    # Пересчёт высоты и размера узла по потомкам
+    def _update(self, node):
+        node.height = 1 + max(self._get_height(node.left),
+                              self._get_height(node.right))
+        node.size = 1 + self._get_size(node.left) + self._get_size(node.right)
+
+    # Расчет баланс-фактора (разница высот поддеревьев)
+    def _get_balance(self, node):
+        if not node:
+            return 0
+        return self._get_height(node.left) - self._get_height(node.right)
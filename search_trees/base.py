@@ -0,0 +1,84 @@
+"""
+Базовый класс деревьев поиска и общий протокол структур для сравнения:
+- insert(key) - вставка ключа
+- search(key) - проверка наличия ключа
+- delete(key) - удаление ключа (отсутствующий ключ игнорируется)
+- iter(tree) - ключи в порядке возрастания
+- depth_stats() - статистика глубин дерева
+Обход и статистика глубин итеративны, поэтому не зависят от лимита рекурсии.
+"""
+
+from collections import Counter, namedtuple
+
+# Максимальная глубина, средняя глубина листьев и гистограмма
+# глубин листьев (Counter: глубина -> количество листьев)
+DepthStats = namedtuple('DepthStats', ['max_depth', 'mean_leaf_depth', 'histogram'])
+
+
+def depth_stats(root):
+    """Статистика глубин дерева с корнем root за один итеративный обход
+    (корень - глубина 1). Подходит для любых узлов с полями left/right.
+    Вместо списка глубин всех листьев хранится гистограмма"""
+    histogram = Counter()
+    max_depth = 0
+    stack = [(root, 1)] if root else []
+    while stack:
+        node, depth = stack.pop()
+        if depth > max_depth:
+            max_depth = depth
+        if node.left is None and node.right is None:  # Если это лист
+            histogram[depth] += 1
+            continue
+        if node.left:
+            stack.append((node.left, depth + 1))
+        if node.right:
+            stack.append((node.right, depth + 1))
+
+    leaves = sum(histogram.values())
+    mean_leaf_depth = sum(depth * count for depth, count in histogram.items()) / leaves if leaves else 0
+    return DepthStats(max_depth, mean_leaf_depth, histogram)
+
+
+class SearchTree:
+    """Общая часть деревьев поиска: корень, поиск, обход и статистика глубин"""
+    def __init__(self):
+        self.root = None  # Корень дерева
+
+    def search(self, key):
+        """Итеративный поиск ключа в дереве"""
+        node = self.root
+        while node:
+            if key == node.key:
+                return True
+            node = node.left if key < node.key else node.right
+        return False
+
+    def iter_in_order(self):
+        """Итеративный обход (in-order): генератор с явным стеком"""
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    def __iter__(self):
+        return self.iter_in_order()
+
+    def in_order(self):
+        """Обход (in-order) в виде списка"""
+        return list(self.iter_in_order())
+
+    def _min_value_node(self, node):
+        """Поиск узла с минимальным ключом в поддереве"""
+        current = node
+        while current.left:
+            current = current.left
+        return current
+
+    def depth_stats(self):
+        """Статистика глубин дерева (см. depth_stats)"""
+        return depth_stats(self.root)
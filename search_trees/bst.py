@@ -0,0 +1,142 @@
+"""
+Класс BST реализует бинарное дерево поиска с основными операциями:
+- вставка (insert)
+- поиск (search)
+- удаление (delete)
+- обход (in_order)
+- порядковые статистики (rank, select, count_range, range)
+Узлы хранят размер поддерева, который поддерживается при вставке и удалении.
+"""
+
+from .base import SearchTree
+from .nodes import SizedNode
+
+
+class BST(SearchTree):
+    # Вставка нового ключа в дерево (итеративная реализация)
+    def insert(self, key):
+        if not self.root:
+            self.root = SizedNode(key)
+            return
+
+        current = self.root
+        while True:
+            current.size += 1  # Новый узел окажется в поддереве каждого узла пути
+            if key < current.key:  # Идем в левое поддерево
+                if not current.left:
+                    current.left = SizedNode(key)
+                    break
+                else:
+                    current = current.left
+            else:  # Идем в правое поддерево
+                if not current.right:
+                    current.right = SizedNode(key)
+                    break
+                else:
+                    current = current.right
+
+    # Итеративное удаление ключа из дерева
+    def delete(self, key):
+        # Ищем удаляемый узел и его родителя, запоминая путь от корня
+        path = []
+        parent = None
+        node = self.root
+        while node and key != node.key:
+            path.append(node)
+            parent = node
+            node = node.left if key < node.key else node.right
+        if node is None:
+            return
+
+        # Узел с двумя потомками - копируем минимальный ключ правого поддерева
+        # и удаляем узел, в котором он хранился (у него нет левого потомка)
+        if node.left and node.right:
+            path.append(node)
+            parent = node
+            successor = node.right
+            while successor.left:
+                path.append(successor)
+                parent = successor
+                successor = successor.left
+            node.key = successor.key
+            node = successor
+
+        # Все узлы пути теряют по одному узлу в поддереве
+        for ancestor in path:
+            ancestor.size -= 1
+
+        # Узел с одним потомком или без потомков - заменяем его потомком
+        child = node.left if node.left else node.right
+        if parent is None:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+
+    # Получение размера поддерева
+    def _get_size(self, node):
+        if not node:
+            return 0
+        return node.size
+
+    # Количество ключей в дереве
+    def __len__(self):
+        return self._get_size(self.root)
+
+    # Количество ключей меньше key (или не больше key при inclusive=True), O(h)
+    def _count_less(self, key, inclusive=False):
+        count = 0
+        node = self.root
+        while node:
+            if key < node.key or (key == node.key and not inclusive):
+                node = node.left
+            else:
+                count += 1 + self._get_size(node.left)
+                node = node.right
+        return count
+
+    # Ранг ключа: количество ключей, строго меньших key
+    def rank(self, key):
+        return self._count_less(key)
+
+    # k-й по возрастанию ключ (нумерация с 0)
+    def select(self, k):
+        if not 0 <= k < len(self):
+            raise IndexError("select: индекс вне диапазона")
+        node = self.root
+        while True:
+            left_size = self._get_size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.key
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    # Количество ключей в отрезке [lo, hi]
+    def count_range(self, lo, hi):
+        if hi < lo:
+            return 0
+        return self._count_less(hi, inclusive=True) - self._count_less(lo)
+
+    # Итератор по ключам из отрезка [lo, hi] в порядке возрастания:
+    # спуск к lo за O(h), далее обычный обход с явным стеком до первого ключа > hi
+    def range(self, lo, hi):
+        stack = []
+        node = self.root
+        while True:
+            while node:
+                if node.key < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.key > hi:
+                return
+            yield node.key
+            node = node.right
@@ -0,0 +1,45 @@
+"""
+Узлы деревьев поиска. Каждый тип дерева использует свой класс узла
+с __slots__, поэтому узел хранит только нужные этому дереву поля
+(без словаря атрибутов): AVL не платит за приоритет Treap,
+а Treap - за высоту и размер поддерева.
+"""
+
+import random
+
+
+class Node:
+    """Базовый узел: ключ и указатели на левого/правого потомка"""
+    __slots__ = ('key', 'left', 'right')
+
+    def __init__(self, key):
+        self.key = key  # Значение узла
+        self.left = None  # Левый потомок
+        self.right = None  # Правый потомок
+
+
+class SizedNode(Node):
+    """Узел BST с размером поддерева (для порядковых статистик)"""
+    __slots__ = ('size',)
+
+    def __init__(self, key):
+        super().__init__(key)
+        self.size = 1  # Количество узлов в поддереве
+
+
+class AVLNode(SizedNode):
+    """Узел AVL-дерева: дополнительно хранит высоту поддерева"""
+    __slots__ = ('height',)
+
+    def __init__(self, key):
+        super().__init__(key)
+        self.height = 1  # Высота поддерева
+
+
+class TreapNode(Node):
+    """Узел Treap: дополнительно хранит приоритет для свойства кучи"""
+    __slots__ = ('priority',)
+
+    def __init__(self, key, priority=None):
+        super().__init__(key)
+        self.priority = priority if priority is not None else random.random()  # Приоритет для Treap
@@ -0,0 +1,153 @@
+"""
+Treap (декартово дерево): дерево поиска по ключам и куча по случайным
+приоритетам. Все операции построены на итеративных split и merge.
+"""
+
+from .base import SearchTree
+from .nodes import TreapNode
+
+
+class Treap(SearchTree):
+    """Реализация структуры данных Treap (декартово дерево)"""
+    def split(self, key):
+        """Разрезание Treap по ключу на два: (ключи < key, ключи >= key).
+        Узлы переходят в результат, само дерево становится пустым"""
+        left, right = type(self)(), type(self)()
+        left.root, right.root = self._split(self.root, key)
+        self.root = None
+        return left, right
+
+    @staticmethod
+    def merge(left, right):
+        """Слияние двух Treap, где все ключи left не больше ключей right.
+        Узлы переходят в результат, исходные деревья становятся пустыми"""
+        treap = Treap()
+        treap.root = Treap._merge(left.root, right.root)
+        left.root = right.root = None
+        return treap
+
+    @staticmethod
+    def _split(node, key):
+        """Итеративное разрезание поддерева: спускаемся по пути поиска key,
+        подвешивая узлы с ключом < key к правому краю левого дерева,
+        а остальные - к левому краю правого"""
+        left_root = right_root = None
+        left_tail = right_tail = None  # Узлы, к которым подвешивается следующая часть
+        while node:
+            if node.key < key:
+                if left_tail is None:
+                    left_root = node
+                else:
+                    left_tail.right = node
+                left_tail = node
+                node = node.right
+            else:
+                if right_tail is None:
+                    right_root = node
+                else:
+                    right_tail.left = node
+                right_tail = node
+                node = node.left
+        if left_tail:
+            left_tail.right = None
+        if right_tail:
+            right_tail.left = None
+        return left_root, right_root
+
+    @staticmethod
+    def _merge(left, right):
+        """Итеративное слияние поддеревьев (ключи left не больше ключей right):
+        на каждом шаге корнем становится узел с большим приоритетом"""
+        root = parent = None
+        parent_right = False  # К какой стороне parent подвешивается следующий узел
+        while left and right:
+            if left.priority > right.priority:
+                node, left, next_right = left, left.right, True
+            else:
+                node, right, next_right = right, right.left, False
+            if parent is None:
+                root = node
+            elif parent_right:
+                parent.right = node
+            else:
+                parent.left = node
+            parent, parent_right = node, next_right
+        rest = left or right
+        if parent is None:
+            return rest
+        if parent_right:
+            parent.right = rest
+        else:
+            parent.left = rest
+        return root
+
+    def insert(self, key, priority=None):
+        """Вставка ключа в Treap: спускаемся, пока приоритеты узлов больше
+        приоритета нового, и разрезаем оставшееся поддерево по ключу
+        на потомков нового узла"""
+        new_node = TreapNode(key, priority)
+        parent = None
+        node = self.root
+        while node and node.priority > new_node.priority:
+            parent = node
+            node = node.left if key < node.key else node.right
+
+        new_node.left, new_node.right = self._split(node, key)
+        if parent is None:
+            self.root = new_node
+        elif key < parent.key:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+
+    def insert_many(self, keys):
+        """Пакетная вставка отсортированных ключей за O(n): декартово дерево
+        строится стеком правого края. Если ключи не больше всех ключей дерева,
+        результат сливается с ним, иначе ключи вставляются по одному"""
+        keys = list(keys)
+        for i in range(1, len(keys)):
+            if keys[i] < keys[i - 1]:
+                raise ValueError("insert_many ожидает отсортированную последовательность")
+        if not keys:
+            return
+
+        if self.root is not None:
+            node = self.root
+            while node.right:
+                node = node.right
+            if keys[0] < node.key:
+                for key in keys:
+                    self.insert(key)
+                return
+
+        # Стек - правый край построенного дерева (приоритеты убывают от дна к вершине)
+        stack = []
+        for key in keys:
+            node = TreapNode(key)
+            last = None
+            while stack and stack[-1].priority < node.priority:
+                last = stack.pop()
+            node.left = last
+            if stack:
+                stack[-1].right = node
+            stack.append(node)
+        self.root = self._merge(self.root, stack[0])
+
+    def delete(self, key):
+        """Удаление ключа из дерева: найденный узел заменяется слиянием
+        его поддеревьев"""
+        parent = None
+        node = self.root
+        while node and node.key != key:
+            parent = node
+            node = node.left if key < node.key else node.right
+        if not node:
+            return
+
+        merged = self._merge(node.left, node.right)
+        if parent is None:
+            self.root = merged
+        elif parent.left is node:
+            parent.left = merged
+        else:
+            parent.right = merged